@@ -8,19 +8,30 @@ from typing import Any
 
 __version__ = version("mcpcat")
 
-from mcpcat.modules.overrides.mcp_server import override_lowlevel_mcp_server
+from mcpcat.modules.overrides.community.monkey_patch import patch_community_fastmcp
+from mcpcat.modules.overrides.community_v3.integration import (
+    apply_community_v3_integration,
+)
+from mcpcat.modules.overrides.mcp_server import (
+    override_lowlevel_mcp_server,
+    override_lowlevel_mcp_server_minimal,
+)
+from mcpcat.modules.overrides.official.monkey_patch import (
+    apply_official_fastmcp_patches,
+)
 from mcpcat.modules.session import get_session_info, new_session_id
 
 from .modules.compatibility import (
     COMPATIBILITY_ERROR_MESSAGE,
-    is_community_fastmcp_v2,
-    is_community_fastmcp_v3,
-    is_compatible_server,
-    is_official_fastmcp_server,
+    SERVER_KIND_COMMUNITY_V2,
+    SERVER_KIND_COMMUNITY_V3,
+    SERVER_KIND_LOWLEVEL,
+    SERVER_KIND_OFFICIAL_FASTMCP,
+    classify_server,
 )
 from .modules.diagnostics import init_diagnostics
 from .modules.internal import set_server_tracking_data
-from .modules.logging import set_debug_mode, write_to_log
+from .modules.logging import set_debug_mode, write_to_log, write_to_log_lazy
 from .types import (
     EventPropertiesFunction,
     EventTagsFunction,
@@ -103,13 +114,12 @@ def track(
                 "Use project_id for MCPCat, exporters for telemetry-only mode, or both."
             )
 
-        if not is_compatible_server(server):
+        # One cached classification instead of re-probing the server per check
+        kind = classify_server(server)
+        if not kind.is_compatible:
             raise TypeError(COMPATIBILITY_ERROR_MESSAGE)
 
-        is_community_v3 = is_community_fastmcp_v3(server)
-        is_community_v2 = is_community_fastmcp_v2(server)
-        is_official_fastmcp = is_official_fastmcp_server(server)
-        is_fastmcp_v2 = is_official_fastmcp or is_community_v2
+        is_fastmcp_v2 = kind.is_official_fastmcp or kind.is_community_v2
 
         # Determine where to store tracking data:
         # - v2 FastMCP servers use server._mcp_server
@@ -124,12 +134,13 @@ def track(
             "fastmcp-v2"
             if is_fastmcp_v2
             else "fastmcp-v3"
-            if is_community_v3
+            if kind.is_community_v3
             else "lowlevel"
         )
-        write_to_log(
-            f"MCPCat setup started | project {project_id or '(telemetry-only)'} | "
-            f"server {server_kind}"
+        write_to_log_lazy(
+            "MCPCat setup started | project %s | server %s",
+            project_id or "(telemetry-only)",
+            server_kind,
         )
 
         if options.exporters:
@@ -138,8 +149,8 @@ def track(
 
             telemetry_manager = TelemetryManager(options.exporters)
             set_telemetry_manager(telemetry_manager)
-            write_to_log(
-                f"Telemetry initialized with {len(options.exporters)} exporter(s)"
+            write_to_log_lazy(
+                "Telemetry initialized with %d exporter(s)", len(options.exporters)
             )
 
         session_id = new_session_id()
@@ -162,33 +173,35 @@ def track(
 
         if not data.tracker_initialized:
             data.tracker_initialized = True
-            write_to_log(
-                f"Dynamic tracking initialized for server {id(lowlevel_server)}"
+            write_to_log_lazy(
+                "Dynamic tracking initialized for server %d", id(lowlevel_server)
             )
 
-        _apply_server_tracking(
-            server, lowlevel_server, data,
-            is_community_v3, is_official_fastmcp, is_community_v2
-        )
+        _apply_server_tracking(server, lowlevel_server, data, kind.flags)
 
         if project_id:
-            write_to_log(
-                f"MCPCat initialized with dynamic tracking for session "
-                f"{session_id} on project {project_id}"
+            write_to_log_lazy(
+                "MCPCat initialized with dynamic tracking for session "
+                "%s on project %s",
+                session_id,
+                project_id,
             )
         else:
-            write_to_log(
-                f"MCPCat initialized in telemetry-only mode for session {session_id}"
+            write_to_log_lazy(
+                "MCPCat initialized in telemetry-only mode for session %s",
+                session_id,
             )
 
         # Metadata-only setup-complete beacon (INFO). A start-without-complete
         # (or the ERROR diagnostics below) signals a failed setup.
-        write_to_log(
-            f"MCPCat setup complete | project {project_id or '(telemetry-only)'} | "
-            f"tracing={options.enable_tracing} "
-            f"context={options.enable_tool_call_context} "
-            f"report_missing={options.enable_report_missing} "
-            f"exporters={len(options.exporters) if options.exporters else 0}"
+        write_to_log_lazy(
+            "MCPCat setup complete | project %s | tracing=%s context=%s "
+            "report_missing=%s exporters=%d",
+            project_id or "(telemetry-only)",
+            options.enable_tracing,
+            options.enable_tool_call_context,
+            options.enable_report_missing,
+            len(options.exporters) if options.exporters else 0,
         )
 
     except (ValueError, TypeError) as e:
@@ -202,46 +215,44 @@ def track(
     return server
 
 
-def _apply_server_tracking(
-    server: Any,
-    lowlevel_server: Any,
-    data: MCPCatData,
-    is_community_v3: bool,
-    is_official_fastmcp: bool,
-    is_community_v2: bool,
+def _track_community_v3(server: Any, lowlevel_server: Any, data: MCPCatData) -> None:
+    apply_community_v3_integration(server, data)
+    write_to_log_lazy(
+        "Applied Community FastMCP v3 middleware for server %d", id(server)
+    )
+
+
+def _track_official_fastmcp(
+    server: Any, lowlevel_server: Any, data: MCPCatData
 ) -> None:
-    """Apply the appropriate tracking method based on server type."""
-    if is_community_v3:
-        from mcpcat.modules.overrides.community_v3.integration import (
-            apply_community_v3_integration,
-        )
+    apply_official_fastmcp_patches(server, data)
+    override_lowlevel_mcp_server_minimal(lowlevel_server, data)
 
-        apply_community_v3_integration(server, data)
-        write_to_log(
-            f"Applied Community FastMCP v3 middleware for server {id(server)}"
-        )
 
-    elif is_official_fastmcp:
-        from mcpcat.modules.overrides.mcp_server import (
-            override_lowlevel_mcp_server_minimal,
-        )
-        from mcpcat.modules.overrides.official.monkey_patch import (
-            apply_official_fastmcp_patches,
-        )
+def _track_community_v2(server: Any, lowlevel_server: Any, data: MCPCatData) -> None:
+    patch_community_fastmcp(server)
+    write_to_log_lazy("Applied Community FastMCP v2 patches for server %d", id(server))
 
-        apply_official_fastmcp_patches(server, data)
-        override_lowlevel_mcp_server_minimal(lowlevel_server, data)
 
-    elif is_community_v2:
-        from mcpcat.modules.overrides.community.monkey_patch import (
-            patch_community_fastmcp,
-        )
+def _track_lowlevel(server: Any, lowlevel_server: Any, data: MCPCatData) -> None:
+    override_lowlevel_mcp_server(lowlevel_server, data)
 
-        patch_community_fastmcp(server)
-        write_to_log(f"Applied Community FastMCP v2 patches for server {id(server)}")
 
-    else:
-        override_lowlevel_mcp_server(lowlevel_server, data)
+# Tracking method per server type flag (ServerKind.flags), so applying
+# tracking is a single lookup
+_TRACKING_DISPATCH = {
+    SERVER_KIND_COMMUNITY_V3: _track_community_v3,
+    SERVER_KIND_OFFICIAL_FASTMCP: _track_official_fastmcp,
+    SERVER_KIND_COMMUNITY_V2: _track_community_v2,
+    SERVER_KIND_LOWLEVEL: _track_lowlevel,
+}
+
+
+def _apply_server_tracking(
+    server: Any, lowlevel_server: Any, data: MCPCatData, kind_flags: int
+) -> None:
+    """Apply the appropriate tracking method based on server type flags."""
+    _TRACKING_DISPATCH[kind_flags](server, lowlevel_server, data)
 
 
 __all__ = [
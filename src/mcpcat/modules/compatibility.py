@@ -1,6 +1,7 @@
 """Compatibility checks for MCP servers."""
 
-from typing import Any, Protocol, runtime_checkable
+import weakref
+from typing import Any, NamedTuple, Protocol, runtime_checkable
 
 from mcp import ServerResult
 
@@ -18,6 +19,20 @@ COMPATIBILITY_ERROR_MESSAGE = (
     f"or MCP Low-level Server instance ({SUPPORTED_MCP_VERSIONS})"
 )
 
+# Attribute names required by the server-type predicates and compatibility
+# checks, built once and tested against a dir() set with <=
+_COMMUNITY_V3_ATTRS = frozenset({"_local_provider", "add_middleware", "middleware"})
+_FASTMCP_V2_ATTRS = frozenset({"_mcp_server", "_tool_manager"})
+_FASTMCP_SERVER_ATTRS = frozenset({"_tool_manager", "add_tool", "_mcp_server"})
+_FASTMCP_TOOL_MANAGER_METHODS = frozenset({"add_tool", "call_tool", "list_tools"})
+_FASTMCP_TOOL_MANAGER_ATTRS = _FASTMCP_TOOL_MANAGER_METHODS | {"_tools"}
+_SERVER_METHODS = frozenset({"list_tools", "call_tool"})
+_REQUEST_HANDLING_ATTRS = frozenset({"request_context", "request_handlers"})
+
+# Sentinel for getattr() probes where None is a meaningful attribute value
+_MISSING = object()
+
+
 @runtime_checkable
 class MCPServerProtocol(Protocol):
     """Protocol for MCP server compatibility."""
@@ -30,6 +45,64 @@ class MCPServerProtocol(Protocol):
         """Call a tool by name."""
         ...
 
+# Server type bit flags (see ServerKind.flags). The server types are mutually
+# exclusive, so at most one bit is set; 0 means a low-level Server.
+SERVER_KIND_LOWLEVEL = 0
+SERVER_KIND_COMMUNITY_V3 = 1
+SERVER_KIND_OFFICIAL_FASTMCP = 2
+SERVER_KIND_COMMUNITY_V2 = 4
+
+
+class ServerKind(NamedTuple):
+    """Classification of a server, as computed by classify_server."""
+
+    is_community_v3: bool
+    is_community_v2: bool
+    is_official_fastmcp: bool
+    is_compatible: bool
+
+    @property
+    def flags(self) -> int:
+        """The server type packed into SERVER_KIND_* bit flags."""
+        return (
+            (SERVER_KIND_COMMUNITY_V3 if self.is_community_v3 else 0)
+            | (SERVER_KIND_OFFICIAL_FASTMCP if self.is_official_fastmcp else 0)
+            | (SERVER_KIND_COMMUNITY_V2 if self.is_community_v2 else 0)
+        )
+
+
+# Classification only depends on the server's class (the probed attributes are
+# all set up by the class or its __init__), so it is computed once per type.
+# Weak keys let dynamically created classes (e.g. mocks) be garbage collected.
+_server_kind_cache: weakref.WeakKeyDictionary[type, ServerKind] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def classify_server(server: Any) -> ServerKind:
+    """Classify a server instance, caching the result per server class."""
+    cls = type(server)
+    kind = _server_kind_cache.get(cls)
+    if kind is None:
+        probe = _probe(server)
+        is_v3 = _is_community_fastmcp_v3(probe)
+        is_v2 = _is_community_fastmcp_v2(probe)
+        is_official = _is_official_fastmcp_server(probe)
+        kind = ServerKind(
+            is_community_v3=is_v3,
+            is_community_v2=is_v2,
+            is_official_fastmcp=is_official,
+            is_compatible=(
+                is_v3
+                or is_v2
+                or is_official
+                or _has_necessary_attributes(server, is_official, probe.attrs)
+            ),
+        )
+        _server_kind_cache[cls] = kind
+    return kind
+
+
 def is_community_fastmcp_v3(server: Any) -> bool:
     """Check if the server is a Community FastMCP v3 instance.
 
@@ -37,23 +110,48 @@ def is_community_fastmcp_v3(server: Any) -> bool:
     instead of the ToolManager architecture with _tool_manager.
     It also has the middleware system with add_middleware method.
     """
+    return classify_server(server).is_community_v3
+
+
+def _attr_set(obj: Any) -> set[str]:
+    """Return the attribute names of *obj* as a set for membership tests.
+
+    Uses dir() rather than repeated hasattr() probes: one call answers every
+    check, and property getters (which might raise) are never triggered.
+    """
+    try:
+        return set(dir(obj))
+    except Exception:
+        return set()
+
+
+class _ServerProbe(NamedTuple):
+    """Class name, module and attribute names read once per classification."""
+
+    class_name: str
+    module_name: str
+    attrs: set[str]
+
+
+def _probe(server: Any) -> _ServerProbe:
+    cls = server.__class__
+    return _ServerProbe(cls.__name__, cls.__module__, _attr_set(server))
+
+
+def _is_community_fastmcp_v3(probe: _ServerProbe) -> bool:
     # Check by class name and module
-    class_name = server.__class__.__name__
-    module_name = server.__class__.__module__
+    if "FastMCP" not in probe.class_name or not probe.module_name.startswith(
+        "fastmcp"
+    ):
+        return False
 
     # Community FastMCP v3 has:
-    # - Class name containing 'FastMCP'
-    # - Module starts with 'fastmcp'
     # - Has _local_provider (Provider architecture)
     # - Has add_middleware method (middleware system)
     # - Does NOT have _tool_manager (v2 attribute)
     return (
-        "FastMCP" in class_name and
-        module_name.startswith("fastmcp") and
-        hasattr(server, "_local_provider") and
-        hasattr(server, "add_middleware") and
-        hasattr(server, "middleware") and
-        not hasattr(server, "_tool_manager")
+        _COMMUNITY_V3_ATTRS <= probe.attrs
+        and "_tool_manager" not in probe.attrs
     )
 
 
@@ -62,21 +160,19 @@ def is_community_fastmcp_v2(server: Any) -> bool:
 
     Community FastMCP v2 uses the ToolManager architecture with _tool_manager.
     """
+    return classify_server(server).is_community_v2
+
+
+def _is_community_fastmcp_v2(probe: _ServerProbe) -> bool:
     # Check by class name and module
-    class_name = server.__class__.__name__
-    module_name = server.__class__.__module__
-
-    # Community FastMCP v2 has:
-    # - Class name containing 'FastMCP'
-    # - Module starts with 'fastmcp'
-    # - Has _mcp_server
-    # - Has _tool_manager (ToolManager architecture)
-    return (
-        "FastMCP" in class_name and
-        module_name.startswith("fastmcp") and
-        hasattr(server, "_mcp_server") and
-        hasattr(server, "_tool_manager")
-    )
+    if "FastMCP" not in probe.class_name or not probe.module_name.startswith(
+        "fastmcp"
+    ):
+        return False
+
+    # Community FastMCP v2 has _mcp_server and _tool_manager (ToolManager
+    # architecture)
+    return _FASTMCP_V2_ATTRS <= probe.attrs
 
 
 def is_community_fastmcp_server(server: Any) -> bool:
@@ -86,7 +182,8 @@ def is_community_fastmcp_server(server: Any) -> bool:
     Supports FastMCP subclasses like FastMCPOpenAPI, FastMCPProxy, etc.
     This function returns True for both v2 and v3.
     """
-    return is_community_fastmcp_v2(server) or is_community_fastmcp_v3(server)
+    kind = classify_server(server)
+    return kind.is_community_v2 or kind.is_community_v3
 
 def is_official_fastmcp_server(server: Any) -> bool:
     """Check if the server is an official FastMCP instance.
@@ -94,18 +191,18 @@ def is_official_fastmcp_server(server: Any) -> bool:
     Official FastMCP comes from the 'mcp.server.fastmcp' module.
     Supports FastMCP subclasses like FastMCPOpenAPI, FastMCPProxy, etc.
     """
-    # Check by class name and module
-    class_name = server.__class__.__name__
-    module_name = server.__class__.__module__
+    return classify_server(server).is_official_fastmcp
 
+
+def _is_official_fastmcp_server(probe: _ServerProbe) -> bool:
     # Official FastMCP has class name containing 'FastMCP' and module
     # 'mcp.server.fastmcp'. Supports FastMCPOpenAPI, FastMCPProxy, etc.
-    return (
-        "FastMCP" in class_name and
-        module_name.startswith("mcp.server.fastmcp") and
-        hasattr(server, "_mcp_server") and
-        hasattr(server, "_tool_manager")
-    )
+    if "FastMCP" not in probe.class_name or not probe.module_name.startswith(
+        "mcp.server.fastmcp"
+    ):
+        return False
+
+    return _FASTMCP_V2_ATTRS <= probe.attrs
 
 
 def has_required_fastmcp_attributes(server: Any) -> bool:
@@ -113,33 +210,29 @@ def has_required_fastmcp_attributes(server: Any) -> bool:
 
     This validates that the server has all the attributes that monkey_patch.py expects.
     """
-    # Check for _tool_manager and its required methods
-    if not hasattr(server, "_tool_manager"):
-        return False
-
-    tool_manager = server._tool_manager
-    required_tool_manager_methods = ["add_tool", "call_tool", "list_tools"]
-    for method in required_tool_manager_methods:
-        if not hasattr(tool_manager, method) or not callable(
-            getattr(tool_manager, method)
-        ):
-            return False
+    server_attrs = _attr_set(server)
 
-    # Check for _tools dict on tool_manager (used for tracking existing tools)
-    if not hasattr(tool_manager, "_tools") or not isinstance(tool_manager._tools, dict):
+    # Check for _tool_manager, add_tool (used for adding get_more_tools) and
+    # _mcp_server (used for event tracking and session management)
+    if not _FASTMCP_SERVER_ATTRS <= server_attrs:
         return False
-
-    # Check for add_tool method on the server itself (used for adding get_more_tools)
-    if not hasattr(server, "add_tool") or not callable(server.add_tool):
+    if not callable(server.add_tool):
         return False
 
-    # Check for _mcp_server (used for event tracking and session management)
-    if not hasattr(server, "_mcp_server"):
+    # Check for the tool manager's required methods and its _tools dict
+    # (used for tracking existing tools)
+    tool_manager = server._tool_manager
+    if not _FASTMCP_TOOL_MANAGER_ATTRS <= _attr_set(tool_manager):
+        return False
+    for method in _FASTMCP_TOOL_MANAGER_METHODS:
+        if not callable(getattr(tool_manager, method)):
+            return False
+    if not isinstance(tool_manager._tools, dict):
         return False
 
     # Check if _mcp_server has _get_cached_tool_definition method
     # (for community FastMCP patching)
-    if not hasattr(server._mcp_server, "_get_cached_tool_definition"):
+    if "_get_cached_tool_definition" not in _attr_set(server._mcp_server):
         return False
 
     return True
@@ -147,57 +240,51 @@ def has_required_fastmcp_attributes(server: Any) -> bool:
 
 def has_necessary_attributes(server: Any) -> bool:
     """Check if the server has necessary attributes for compatibility."""
-    required_methods = ["list_tools", "call_tool"]
+    return _has_necessary_attributes(
+        server, classify_server(server).is_official_fastmcp, _attr_set(server)
+    )
 
+
+def _has_necessary_attributes(
+    server: Any, is_official_fastmcp: bool, server_attrs: set[str]
+) -> bool:
+    """Check attributes; *server_attrs* is the dir() set classify_server computed."""
     # Check for core methods that both FastMCP and Server implementations have
-    for method in required_methods:
-        if not hasattr(server, method):
-            return False
+    if not _SERVER_METHODS <= server_attrs:
+        return False
 
     # For FastMCP servers, verify all required attributes for monkey patching
-    if is_official_fastmcp_server(server):
+    if is_official_fastmcp:
         # Use the comprehensive FastMCP validation
         if not has_required_fastmcp_attributes(server):
             return False
 
-        # Additional checks for request handling
-        # Use dir() to avoid triggering property getters that might raise exceptions
-        if "request_context" not in dir(server._mcp_server):
-            return False
         # Check for get_context method which is FastMCP specific
-        if not hasattr(server, "get_context"):
-            return False
-        # Check for request_handlers dictionary on internal server
-        if not hasattr(server._mcp_server, "request_handlers"):
-            return False
-        if not isinstance(server._mcp_server.request_handlers, dict):
+        if "get_context" not in server_attrs:
             return False
+
+        # Additional checks for request handling on the internal server.
+        # dir() avoids triggering property getters that might raise exceptions
+        handler_server = server._mcp_server
     else:
-        # Regular Server implementation - check for request_context directly
-        # Use dir() to avoid triggering property getters that might raise exceptions
-        if "request_context" not in dir(server):
-            return False
-        # Check for request_handlers dictionary
-        if not hasattr(server, "request_handlers"):
-            return False
-        if not isinstance(server.request_handlers, dict):
-            return False
+        # Regular Server implementation - check request handling directly
+        handler_server = server
+
+    if not _REQUEST_HANDLING_ATTRS <= _attr_set(handler_server):
+        return False
+    if not isinstance(handler_server.request_handlers, dict):
+        return False
 
     return True
 
 
 def is_compatible_server(server: Any) -> bool:
-    """Check if the server is compatible with MCPCat."""
-    # If it's FastMCP v3 (community), it's compatible
-    if is_community_fastmcp_v3(server):
-        return True
-
-    # If it's either official or community FastMCP v2, it's compatible
-    if is_official_fastmcp_server(server) or is_community_fastmcp_v2(server):
-        return True
+    """Check if the server is compatible with MCPCat.
 
-    # Otherwise, check for necessary attributes
-    return has_necessary_attributes(server)
+    Any FastMCP flavour (community v2/v3 or official) is compatible; other
+    servers must expose the low-level Server attributes MCPCat relies on.
+    """
+    return classify_server(server).is_compatible
 
 
 def get_mcp_compatible_error_message(error: Any) -> str:
@@ -208,37 +295,35 @@ def get_mcp_compatible_error_message(error: Any) -> str:
 def is_mcp_error_response(response: ServerResult) -> tuple[bool, str]:
     """Check if the response is an MCP error."""
     # ServerResult is a RootModel, so we need to access its root attribute
-    if not hasattr(response, "root"):
+    result = getattr(response, "root", _MISSING)
+    if result is _MISSING:
         return False, ""
 
-    result = response.root
-
     # Check if it's a CallToolResult with an error
-    if not (hasattr(result, "isError") and result.isError):
+    if not getattr(result, "isError", False):
         return False, ""
 
     # Extract error message from content
-    if not (hasattr(result, "content") and result.content):
+    content = getattr(result, "content", None)
+    if not content:
         return True, "Unknown error"
 
     # content is a list of TextContent/ImageContent/EmbeddedResource
-    for content_item in result.content:
+    for content_item in content:
         # Check if it has a text attribute (TextContent)
-        if hasattr(content_item, "text"):
-            return True, str(content_item.text)
+        text = getattr(content_item, "text", _MISSING)
+        if text is not _MISSING:
+            return True, str(text)
         # Check if it has type and content attributes
+        item_content = getattr(content_item, "content", _MISSING)
         if (
-            hasattr(content_item, "type")
-            and hasattr(content_item, "content")
-            and content_item.type == "text"
+            item_content is not _MISSING
+            and getattr(content_item, "type", None) == "text"
         ):
-            return True, str(content_item.content)
+            return True, str(item_content)
 
     # If no text content found, stringify the first item
-    if result.content:
-        return True, str(result.content[0])
-
-    return True, "Unknown error"
+    return True, str(content[0])
 
 __all__ = [
     # Version constants
@@ -247,7 +332,13 @@ __all__ = [
     "SUPPORTED_COMMUNITY_FASTMCP_VERSIONS",
     "SUPPORTED_COMMUNITY_FASTMCP_V3_VERSIONS",
     "COMPATIBILITY_ERROR_MESSAGE",
+    # Server type flags
+    "SERVER_KIND_LOWLEVEL",
+    "SERVER_KIND_COMMUNITY_V3",
+    "SERVER_KIND_OFFICIAL_FASTMCP",
+    "SERVER_KIND_COMMUNITY_V2",
     # Functions
+    "classify_server",
     "is_compatible_server",
     "is_official_fastmcp_server",
     "is_community_fastmcp_server",
@@ -257,6 +348,8 @@ __all__ = [
     "has_necessary_attributes",
     "get_mcp_compatible_error_message",
     "is_mcp_error_response",
+    # Types
+    "ServerKind",
     # Protocols
     "MCPServerProtocol",
 ]
@@ -306,21 +306,18 @@ def publish_event(server: Any, event: UnredactedEvent) -> None:
 
     session_info = get_session_info(server, data)
 
-    # Create full event with all required fields
-    # Merge event data with session info
-    event_data = event.model_dump(exclude_none=True)
-    session_data = session_info.model_dump(exclude_none=True)
-
-    # Merge data, ensuring project_id from data takes precedence
-    merged_data = {**event_data, **session_data}
-    merged_data["project_id"] = (
-        data.project_id
-    )  # Override with tracking data's project_id
-
-    full_event = UnredactedEvent(
-        **merged_data,
-        redaction_fn=data.options.redact_sensitive_information,
-    )
+    # Create full event with all required fields by merging session info into
+    # the event's non-None fields. The merged event is validated here, once,
+    # for every integration (some build events with model_construct). Fields
+    # are read off the model rather than dumped, so nested payloads aren't
+    # serialized just to be rebuilt
+    merged = {name: value for name, value in event if value is not None}
+    merged.update(session_info.model_dump(exclude_none=True))
+    # Override with tracking data's project_id
+    merged["project_id"] = data.project_id
+    merged["redaction_fn"] = data.options.redact_sensitive_information
+
+    full_event = UnredactedEvent.model_validate(merged)
 
     set_last_activity(server)
     event_queue.add(full_event)
@@ -7,6 +7,7 @@ import re
 import sys
 import traceback
 import types
+from functools import lru_cache
 from typing import Any
 
 from mcpcat.types import ChainedErrorData, ErrorData, StackFrame
@@ -16,6 +17,20 @@ _captured_error: contextvars.ContextVar[BaseException | None] = contextvars.Cont
     "_captured_error", default=None
 )
 
+# Sentinel for getattr lookups where None is a meaningful value
+_MISSING = object()
+
+# Library path classification data for is_in_app, computed once at import.
+# Paths are normalized to forward slashes so Windows paths match too.
+_SITE_PACKAGES_RE = re.compile(r"[\\/](?:dist|site)-packages[\\/]")
+_STDLIB_PREFIXES: tuple[str, ...] = tuple(
+    os.path.join(stdlib, "lib").replace("\\", "/")
+    for stdlib in (sys.prefix, sys.base_prefix, getattr(sys, "real_prefix", None))
+    if stdlib
+)
+# Catches cases like Homebrew Python on macOS
+_STDLIB_VERSION_SUBSTR = f"/lib/python{sys.version_info.major}.{sys.version_info.minor}/"
+
 
 def capture_exception(exc: BaseException | Any) -> ErrorData:
     """
@@ -32,10 +47,11 @@ def capture_exception(exc: BaseException | Any) -> ErrorData:
     Returns:
         ErrorData dict with structured error information including platform="python"
     """
-    if is_call_tool_result(exc):
-        return capture_call_tool_result_error(exc)
-
+    # Real exceptions are the common case; only other values need the
+    # CallToolResult / non-exception handling.
     if not isinstance(exc, BaseException):
+        if is_call_tool_result(exc):
+            return capture_call_tool_result_error(exc)
         return {
             "message": stringify_non_exception(exc),
             "type": None,
@@ -76,12 +92,14 @@ def parse_python_traceback(tb: types.TracebackType | None) -> list[StackFrame]:
         return []
 
     frames: list[StackFrame] = []
+    # Source lines per file, fetched once even when many frames share a file
+    file_lines: dict[str, list[str]] = {}
     current_tb = tb
     count = 0
 
     while current_tb is not None and count < MAX_STACK_FRAMES:
         frame = current_tb.tb_frame
-        abs_path = os.path.abspath(frame.f_code.co_filename)
+        abs_path = _abspath(frame.f_code.co_filename)
 
         try:
             module = frame.f_globals.get("__name__")
@@ -100,9 +118,15 @@ def parse_python_traceback(tb: types.TracebackType | None) -> list[StackFrame]:
         }
 
         if in_app:
-            context = extract_context_line(abs_path, current_tb.tb_lineno)
-            if context:
-                frame_dict["context_line"] = context
+            lines = file_lines.get(abs_path)
+            if lines is None:
+                lines = _get_source_lines(abs_path)
+                file_lines[abs_path] = lines
+            lineno = current_tb.tb_lineno
+            if lineno and 0 < lineno <= len(lines):
+                context = lines[lineno - 1].rstrip("\n")
+                if context:
+                    frame_dict["context_line"] = context
 
         frames.append(frame_dict)
 
@@ -112,6 +136,37 @@ def parse_python_traceback(tb: types.TracebackType | None) -> list[StackFrame]:
     return frames
 
 
+@lru_cache(maxsize=1024)
+def _abspath(filename: str) -> str:
+    """os.path.abspath memoized per code object filename.
+
+    abspath calls os.getcwd() on every use, while the same few source files
+    make up most frames of every traceback.
+    """
+    return os.path.abspath(filename)
+
+
+# Project root of each base module seen in a stack frame. Only successful
+# lookups are kept so a package imported later is still picked up.
+_base_module_dirs: dict[str, str] = {}
+
+
+def _base_module_dir(base_module: str) -> str | None:
+    """Find and cache the directory a base module's filenames are relative to."""
+    if base_module not in sys.modules:
+        return None
+
+    base_module_file = getattr(sys.modules[base_module], "__file__", None)
+    if not base_module_file:
+        return None
+
+    # Navigate up 2 levels from package's __init__.py to find project root
+    # e.g., /project/myapp/__init__.py → rsplit by separator twice → /project
+    base_module_dir = base_module_file.rsplit(os.sep, 2)[0]
+    _base_module_dirs[base_module] = base_module_dir
+    return base_module_dir
+
+
 def filename_for_module(module: str | None, abs_path: str) -> str:
     """
     Creates module-relative filename from absolute path.
@@ -145,16 +200,11 @@ def filename_for_module(module: str | None, abs_path: str) -> str:
         if base_module == module:
             return os.path.basename(abs_path)
 
-        if base_module not in sys.modules:
-            return abs_path
-
-        base_module_file = getattr(sys.modules[base_module], "__file__", None)
-        if not base_module_file:
-            return abs_path
-
-        # Navigate up 2 levels from package's __init__.py to find project root
-        # e.g., /project/myapp/__init__.py → rsplit by separator twice → /project
-        base_module_dir = base_module_file.rsplit(os.sep, 2)[0]
+        base_module_dir = _base_module_dirs.get(base_module)
+        if base_module_dir is None:
+            base_module_dir = _base_module_dir(base_module)
+            if base_module_dir is None:
+                return abs_path
 
         # Extract the path relative to the project root
         if abs_path.startswith(base_module_dir):
@@ -165,6 +215,7 @@ def filename_for_module(module: str | None, abs_path: str) -> str:
         return abs_path
 
 
+@lru_cache(maxsize=4096)
 def is_in_app(abs_path: str) -> bool:
     """
     Determines if a file path represents user code (True) or library code (False).
@@ -174,6 +225,9 @@ def is_in_app(abs_path: str) -> bool:
     - Python stdlib paths
     - Paths containing /lib/pythonX.Y/
 
+    Results are memoized per path: the interpreter prefixes it compares
+    against do not change after startup.
+
     Args:
         abs_path: Absolute file path to check
 
@@ -183,31 +237,27 @@ def is_in_app(abs_path: str) -> bool:
     if not abs_path:
         return False
 
-    if re.search(r"[\\/](?:dist|site)-packages[\\/]", abs_path):
+    if _SITE_PACKAGES_RE.search(abs_path):
         return False
 
-    stdlib_paths = [sys.prefix, sys.base_prefix]
-    if hasattr(sys, "real_prefix"):  # virtualenv
-        stdlib_paths.append(sys.real_prefix)
-
-    for stdlib in stdlib_paths:
-        if not stdlib:
-            continue
-        stdlib_lib = os.path.join(stdlib, "lib")
-        normalized_stdlib = stdlib_lib.replace("\\", "/")
-        normalized_path = abs_path.replace("\\", "/")
-        if normalized_path.startswith(normalized_stdlib):
-            return False
-
-    # Catches cases like Homebrew Python on macOS
-    python_version = f"python{sys.version_info.major}.{sys.version_info.minor}"
-    stdlib_pattern = f"/lib/{python_version}/"
-    if stdlib_pattern in abs_path.replace("\\", "/"):
+    normalized_path = abs_path.replace("\\", "/")
+    if normalized_path.startswith(_STDLIB_PREFIXES):
+        return False
+
+    if _STDLIB_VERSION_SUBSTR in normalized_path:
         return False
 
     return True
 
 
+def _get_source_lines(abs_path: str) -> list[str]:
+    """Return all source lines of a file via linecache (empty if unavailable)."""
+    try:
+        return linecache.getlines(abs_path)
+    except Exception:
+        return []
+
+
 def extract_context_line(abs_path: str, lineno: int) -> str | None:
     """
     Extracts the line of code at the specified line number.
@@ -258,10 +308,12 @@ def unwrap_exception_chain(exc: BaseException) -> list[ChainedErrorData]:
     seen_ids.add(id(exc))
 
     while current is not None and depth < MAX_EXCEPTION_CHAIN_DEPTH:
-        if getattr(current, "__suppress_context__", False):
-            next_exc = getattr(current, "__cause__", None)
+        # Every BaseException has these attributes; only BaseExceptions are
+        # ever assigned to current
+        if current.__suppress_context__:
+            next_exc = current.__cause__
         else:
-            next_exc = getattr(current, "__context__", None)
+            next_exc = current.__context__
 
         if next_exc is None:
             break
@@ -287,7 +339,9 @@ def unwrap_exception_chain(exc: BaseException) -> list[ChainedErrorData]:
 
         if next_exc.__traceback__:
             chained_data["frames"] = parse_python_traceback(next_exc.__traceback__)
-            chained_data["stack"] = format_exception_string(next_exc)
+            # The root error's stack already renders the whole chain, so each
+            # chained error only needs its own traceback section.
+            chained_data["stack"] = format_exception_string(next_exc, chain=False)
 
         chain.append(chained_data)
         current = next_exc
@@ -299,7 +353,7 @@ def unwrap_exception_chain(exc: BaseException) -> list[ChainedErrorData]:
     return chain
 
 
-def format_exception_string(exc: BaseException) -> str:
+def format_exception_string(exc: BaseException, chain: bool = True) -> str:
     """
     Formats exception into full traceback string.
 
@@ -308,12 +362,15 @@ def format_exception_string(exc: BaseException) -> str:
 
     Args:
         exc: Exception to format
+        chain: Whether to include the __cause__/__context__ chain
 
     Returns:
         Formatted traceback string
     """
     try:
-        return "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+        return "".join(
+            traceback.format_exception(type(exc), exc, exc.__traceback__, chain=chain)
+        )
     except Exception:
         return f"{type(exc).__name__}: {exc}"
 
@@ -333,8 +390,7 @@ def is_call_tool_result(value: Any) -> bool:
     """
     return (
         value is not None
-        and hasattr(value, "isError")
-        and hasattr(value, "content")
+        and getattr(value, "isError", _MISSING) is not _MISSING
         and isinstance(getattr(value, "content", None), list)
     )
 
@@ -3,16 +3,21 @@ from datetime import datetime, timezone
 from mcpcat.modules import event_queue
 from mcpcat.modules.internal import get_server_tracking_data
 from mcpcat.modules.logging import write_to_log
-from mcpcat.types import EventType, UnredactedEvent, UserIdentity
+from mcpcat.modules.session import get_client_info_from_request_context
+from mcpcat.types import EventType, MCPCatData, UnredactedEvent, UserIdentity
 
 
-def identify_session(server, request: any, context: any) -> UserIdentity | None:
+def identify_session(
+    server, request: any, context: any, data: MCPCatData | None = None
+) -> UserIdentity | None:
     """Run the configured identify hook and publish a `mcpcat:identify` event.
 
     Returns the resulting UserIdentity, or None if no hook is configured, the
-    hook raises, or it returns a non-UserIdentity value.
+    hook raises, or it returns a non-UserIdentity value. *data* is the server's
+    tracking data if the caller already looked it up.
     """
-    data = get_server_tracking_data(server)
+    if data is None:
+        data = get_server_tracking_data(server)
 
     if not data or not data.options or not data.options.identify:
         return None
@@ -40,3 +45,20 @@ def identify_session(server, request: any, context: any) -> UserIdentity | None:
     except Exception as e:
         write_to_log(f"Error occurred during user identification: {e}")
         return None
+
+
+def identify_and_capture_client(
+    server, request: any, context: any
+) -> tuple[str | None, str | None, UserIdentity | None]:
+    """Capture client info and identify the session for a request.
+
+    Same as get_client_info_from_request_context followed by identify_session,
+    with the server's tracking data looked up once for both.
+
+    Returns (client_name, client_version, identity).
+    """
+    data = get_server_tracking_data(server)
+    client_name, client_version = get_client_info_from_request_context(
+        server, context, data
+    )
+    return client_name, client_version, identify_session(server, request, context, data)
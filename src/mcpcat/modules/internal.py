@@ -3,7 +3,7 @@
 import inspect
 import weakref
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from ..types import EventType, MCPCatData, ToolRegistration, UnredactedEvent
 from .compatibility import is_official_fastmcp_server
@@ -75,6 +75,36 @@ def mark_tool_tracked(server: Any, name: str) -> None:
         data.wrapped_tools.add(name)
 
 
+def register_tools(server: Any, names: Iterable[str]) -> None:
+    """Register several tools, looking up the server's tracking data once."""
+    data = get_server_tracking_data(server)
+    if not data:
+        return
+    registry = data.tool_registry
+    now = None
+    for name in names:
+        if name not in registry:
+            if now is None:
+                now = datetime.now(timezone.utc)
+            registry[name] = ToolRegistration(name=name, registered_at=now)
+            write_to_log(f"Registered tool '{name}'")
+
+
+def mark_tools_tracked(server: Any, names: Iterable[str]) -> None:
+    """Mark several tools as tracked, looking up the tracking data once."""
+    data = get_server_tracking_data(server)
+    if not data:
+        return
+    registry = data.tool_registry
+    wrapped_tools = data.wrapped_tools
+    for name in names:
+        registration = registry.get(name)
+        if registration is not None:
+            registration.tracked = True
+            registration.wrapped = True
+            wrapped_tools.add(name)
+
+
 def is_tool_tracked(server: Any, name: str) -> bool:
     """Check if a tool is already being tracked for this server."""
     data = get_server_tracking_data(server)
@@ -1,20 +1,32 @@
 """Logging functionality for MCPCat."""
 
+import atexit
 import os
-from collections.abc import Callable
-from datetime import datetime, timezone
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from itertools import groupby
+from operator import itemgetter
 
-from mcpcat.types import MCPCatOptions
+from mcpcat.modules.constants import LOG_PATH
 
 
-# Initialize debug_mode from environment variable at module load time
-_env_debug = os.getenv("MCPCAT_DEBUG_MODE")
-if _env_debug is not None:
-    debug_mode = _env_debug.lower() in ("true", "1", "yes", "on")
-else:
-    debug_mode = False
+def _read_env_debug_mode() -> bool:
+    value = os.getenv("MCPCAT_DEBUG_MODE")
+    return value is not None and value.lower() in ("true", "1", "yes", "on")
 
 
+# Resolve the MCPCAT_DEBUG_MODE environment variable once at module load time.
+# When set, it forces debug logging on regardless of MCPCatOptions.debug_mode.
+_env_debug_mode = _read_env_debug_mode()
+# Last value passed to set_debug_mode (MCPCatOptions.debug_mode)
+_option_debug_mode = False
+debug_mode = _env_debug_mode
+
+# Always use ~/mcpcat.log, expanded once rather than on every write
+_log_path = os.path.expanduser(f"~/{LOG_PATH}")
+
 # Optional sink that receives every (clean, newline-free) log entry. Used by the
 # diagnostics module to mirror internal logs to MCPCat's monitoring. Fires
 # independent of debug_mode and must never break logging.
@@ -22,9 +34,17 @@ _diagnostics_sink: Callable[[str], None] | None = None
 
 
 def set_debug_mode(value: bool) -> None:
-    """Set the global debug_mode value."""
-    global debug_mode
-    debug_mode = value
+    """Set the global debug_mode value (MCPCAT_DEBUG_MODE still forces it on)."""
+    global _option_debug_mode, debug_mode
+    _option_debug_mode = bool(value)
+    debug_mode = _option_debug_mode or _env_debug_mode
+
+
+def _refresh_debug_flag() -> None:
+    """Re-read MCPCAT_DEBUG_MODE after the environment changed (for tests)."""
+    global _env_debug_mode, debug_mode
+    _env_debug_mode = _read_env_debug_mode()
+    debug_mode = _option_debug_mode or _env_debug_mode
 
 
 def set_diagnostics_sink(fn: Callable[[str], None] | None) -> None:
@@ -33,25 +53,226 @@ def set_diagnostics_sink(fn: Callable[[str], None] | None) -> None:
     _diagnostics_sink = fn
 
 
+_LogEntry = tuple[str, int, str, tuple]
+
+
+class _LogWriter:
+    """Batches debug log entries and writes them from a background thread.
+
+    Callers only append to a deque (atomic under the GIL, no queue locks) and
+    set an Event; a daemon thread drains everything pending and issues one
+    os.write() per batch on a long-lived O_APPEND descriptor, instead of one
+    write per entry on the caller's thread. O_APPEND keeps each batch
+    contiguous even when several processes share ~/mcpcat.log. Entries are
+    queued as (path, time_ns, fmt, args); the timestamp and message are only
+    formatted by the writer, off the caller's thread. The deque is a bounded
+    ring so a stalled disk can't grow memory without limit (the oldest
+    entries are dropped when full).
+    """
+
+    def __init__(self, max_queue_size: int = 10000, max_batch_size: int = 512):
+        self.max_queue_size = max_queue_size
+        self.max_batch_size = max_batch_size
+        self._buffer: deque[_LogEntry | threading.Event] = deque(
+            maxlen=max_queue_size
+        )
+        self._wake = threading.Event()
+        self._fd: int | None = None
+        self._fd_path: str | None = None
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def add(self, path: str, time_ns: int, fmt: str, args: tuple = ()) -> None:
+        """Queue a log entry for *path*, starting the writer thread if needed."""
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._worker, name="mcpcat-log-writer", daemon=True
+                    )
+                    self._thread.start()
+        self._buffer.append((path, time_ns, fmt, args))
+        self._wake.set()
+
+    def _worker(self) -> None:
+        """Writer thread: wait to be woken, then drain and write in batches."""
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            while self._buffer:
+                self._drain_batch()
+
+    def _drain_batch(self) -> None:
+        batch: list[_LogEntry] = []
+        # flush() markers queued behind the entries in this batch
+        flushed: list[threading.Event] = []
+        try:
+            while len(batch) < self.max_batch_size:
+                item = self._buffer.popleft()
+                if isinstance(item, threading.Event):
+                    flushed.append(item)
+                else:
+                    batch.append(item)
+        except IndexError:
+            pass
+        try:
+            if batch:
+                self._write_batch(batch)
+        except Exception:
+            # Silently fail - we don't want logging errors to break the server
+            pass
+        finally:
+            for marker in flushed:
+                marker.set()
+
+    def _write_batch(self, batch: list[_LogEntry]) -> None:
+        with self._lock:
+            # One write per run of entries for the same path (the path only
+            # changes if _log_path is reassigned, e.g. in tests)
+            for path, entries in groupby(batch, key=itemgetter(0)):
+                data = _render_entries(entries).encode("utf-8", "replace")
+                fd = self._get_fd(path)
+                # os.write may be partial; EINTR is retried by Python itself
+                while data:
+                    data = data[os.write(fd, data) :]
+
+    def _get_fd(self, path: str) -> int:
+        """Return the open append descriptor for *path*. Call with _lock held."""
+        if self._fd is None or self._fd_path != path:
+            self._close_fd()
+            self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            self._fd_path = path
+        return self._fd
+
+    def _close_fd(self) -> None:
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            finally:
+                self._fd = None
+                self._fd_path = None
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Block until every entry queued so far has been written."""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        marker = threading.Event()
+        self._buffer.append(marker)
+        self._wake.set()
+        # Bounded wait: the marker itself is dropped if the ring overflows
+        marker.wait(timeout)
+
+    def flush_and_close(self) -> None:
+        """Write pending entries and close the log file. Never raises."""
+        try:
+            self.flush()
+            with self._lock:
+                self._close_fd()
+        except Exception:
+            pass
+
+    def _reset_after_fork(self) -> None:
+        """Forked children don't inherit the writer thread: start over."""
+        self._buffer = deque(maxlen=self.max_queue_size)
+        self._wake = threading.Event()
+        try:
+            self._close_fd()
+        except OSError:
+            pass
+        self._lock = threading.Lock()
+        self._thread = None
+
+
+def _render_entries(entries: Iterable[_LogEntry]) -> str:
+    """Format queued (path, time_ns, fmt, args) entries as log lines.
+
+    Entries in a batch are usually within the same second, so the date/time
+    part of the timestamp is only rebuilt when the second changes.
+    """
+    lines = []
+    last_second = -1
+    prefix = ""
+    for _, time_ns, fmt, args in entries:
+        second, micros = divmod(time_ns // 1000, 1_000_000)
+        if second != last_second:
+            prefix = _timestamp_prefix(second)
+            last_second = second
+        message = _format_message(fmt, args)
+        lines.append(f"[{prefix}.{micros:06d}+00:00] {message}\n")
+    return "".join(lines)
+
+
+def _format_message(fmt: str, args: tuple) -> str:
+    """%-format a lazy log message. Never raises: a bad format logs raw."""
+    if not args:
+        return fmt
+    try:
+        return fmt % args
+    except Exception:
+        return f"{fmt} {args!r}"
+
+
+_log_writer = _LogWriter()
+atexit.register(_log_writer.flush_and_close)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_log_writer._reset_after_fork)
+
+
+def flush_log() -> None:
+    """Block until every debug log entry written so far is on disk."""
+    _log_writer.flush()
+
+
+def _timestamp_prefix(second: int) -> str:
+    """The YYYY-MM-DDTHH:MM:SS part of a UTC timestamp."""
+    t = time.gmtime(second)
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}T"
+        f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+    )
+
+
+def _utc_timestamp(time_ns: int | None = None) -> str:
+    """UTC time (default: now) in ISO 8601 format with microseconds.
+
+    Equivalent to datetime.now(timezone.utc).isoformat() (except that the
+    microseconds are always present) without building a datetime per entry.
+    """
+    if time_ns is None:
+        time_ns = time.time_ns()
+    second, micros = divmod(time_ns // 1000, 1_000_000)
+    return f"{_timestamp_prefix(second)}.{micros:06d}+00:00"
+
+
 def write_to_log(message: str) -> None:
-    timestamp = datetime.now(timezone.utc).isoformat()
-    log_entry = f"[{timestamp}] {message}"
+    # Nothing consumes the entry: skip the clock read entirely
+    if not debug_mode and _diagnostics_sink is None:
+        return
+
+    now = time.time_ns()
 
     # Tee to diagnostics FIRST — independent of debug_mode. Must never break logging.
     if _diagnostics_sink is not None:
         try:
-            _diagnostics_sink(log_entry)
+            _diagnostics_sink(f"[{_utc_timestamp(now)}] {message}")
         except Exception:
             pass
 
-    # Always use ~/mcpcat.log
-    log_path = os.path.expanduser("~/mcpcat.log")
+    if debug_mode:
+        # Written to the log file by the background writer (no need to ensure
+        # directory exists for home directory)
+        _log_writer.add(_log_path, now, message)
 
-    try:
-        if debug_mode:
-            # Write to log file (no need to ensure directory exists for home directory)
-            with open(log_path, "a") as f:
-                f.write(log_entry + "\n")
-    except Exception:
-        # Silently fail - we don't want logging errors to break the server
-        pass
+
+def write_to_log_lazy(fmt: str, *args: object) -> None:
+    """Like write_to_log, but only %-formats the message if it will be logged.
+
+    Use on hot paths so the message isn't built when debug mode is off and no
+    diagnostics sink is registered (the production default). When only the
+    log file consumes it, formatting happens on the background writer thread.
+    """
+    if _diagnostics_sink is not None:
+        # The sink needs the finished message now
+        write_to_log(_format_message(fmt, args))
+    elif debug_mode:
+        _log_writer.add(_log_path, time.time_ns(), fmt, args)
@@ -13,14 +13,11 @@ from mcp import ServerResult
 from mcpcat.modules import event_queue
 from mcpcat.modules.compatibility import is_mcp_error_response
 from mcpcat.modules.exceptions import capture_exception
-from mcpcat.modules.identify import identify_session
+from mcpcat.modules.identify import identify_and_capture_client
 from mcpcat.modules.internal import attach_event_metadata, get_server_tracking_data
 from mcpcat.modules.logging import write_to_log
 from mcpcat.modules.request_extra import params_with_extra
-from mcpcat.modules.session import (
-    get_client_info_from_request_context,
-    get_server_session_id,
-)
+from mcpcat.modules.session import get_server_session_id
 from mcpcat.types import EventType, UnredactedEvent
 
 from ..mcp_server import override_lowlevel_mcp_server_minimal, safe_request_context
@@ -99,8 +96,9 @@ def patch_community_fastmcp(server: Any) -> None:
 
             # Handle session identification
             try:
-                client_name, client_version = get_client_info_from_request_context(lowlevel_server, request_context)
-                identity = identify_session(lowlevel_server, request, request_context)
+                client_name, client_version, identity = identify_and_capture_client(
+                    lowlevel_server, request, request_context
+                )
             except Exception as e:
                 client_name, client_version = None, None
                 identity = None
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any
 
 from mcpcat.modules.compatibility import is_community_fastmcp_server
@@ -9,37 +10,68 @@ from mcpcat.modules.internal import (
     register_tool,
     mark_tool_tracked,
 )
-from mcpcat.modules.logging import write_to_log
-from mcpcat.modules.tools import handle_report_missing
+from mcpcat.modules.logging import write_to_log, write_to_log_lazy
+from mcpcat.modules.tools import GET_MORE_TOOLS_SCHEMA, handle_report_missing
 
 from fastmcp import FastMCP
 
 
+@lru_cache(maxsize=8)
+def _context_property(description: str) -> dict[str, str]:
+    """Template schema for the 'context' property, built once per description."""
+    return {"type": "string", "description": description}
+
+
 def _ensure_context_parameter(tool: Any, description: str) -> None:
     """Add or overwrite the 'context' parameter in a tool's schema.
 
     Ensures the tool has a valid parameters dict with a 'context' property
-    marked as required.
+    marked as required. The tool is stamped with the description and schema
+    it was applied to, so repeat calls for the same tool are a no-op unless
+    the schema was since edited in place to drop the 'context' property.
     """
-    if not hasattr(tool, "parameters") or not tool.parameters:
+    parameters = getattr(tool, "parameters", None)
+    applied = getattr(tool, "_mcpcat_ctx_applied", None)
+    if (
+        applied is not None
+        and applied[0] == description
+        and applied[1] is parameters
+        and "context" in parameters.get("properties", {})
+    ):
+        return
+
+    if not parameters:
         tool.parameters = {"type": "object", "properties": {}, "required": []}
+        # Re-read in case the model validated (and copied) the assignment
+        parameters = tool.parameters
+
+    # Copied so every tool owns its property dict
+    parameters.setdefault("properties", {})["context"] = _context_property(
+        description
+    ).copy()
 
-    if "properties" not in tool.parameters:
-        tool.parameters["properties"] = {}
+    required = parameters.setdefault("required", [])
+    if not isinstance(required, list):
+        parameters["required"] = ["context"]
+    elif "context" not in required:
+        required.append("context")
 
-    tool.parameters["properties"]["context"] = {
-        "type": "string",
-        "description": description,
-    }
+    try:
+        tool._mcpcat_ctx_applied = (description, parameters)
+    except Exception:
+        # Tools that reject new attributes just skip the fast path
+        pass
+
+
+_GET_MORE_TOOLS_DESCRIPTION = "Check for additional tools whenever your task might benefit from specialized capabilities - even if existing tools could work as a fallback."
 
-    if "required" not in tool.parameters:
-        tool.parameters["required"] = []
 
-    if isinstance(tool.parameters["required"], list):
-        if "context" not in tool.parameters["required"]:
-            tool.parameters["required"].append("context")
-    else:
-        tool.parameters["required"] = ["context"]
+async def _get_more_tools(context: str) -> str:
+    """Check for additional tools whenever your task might benefit from specialized capabilities."""
+    result = await handle_report_missing({"context": context})
+    if result.content:
+        return result.content[0].text
+    return "No additional tools available"
 
 
 def patch_community_fastmcp_tool_manager(server: Any) -> None:
@@ -61,27 +93,19 @@ def patch_community_fastmcp_tool_manager(server: Any) -> None:
         write_to_log("WARNING: Unknown error when tracking community FastMCP. Tracking data for server not initialized.")
         return
 
-    write_to_log(f"Patching community FastMCP tool manager for server {id(server)}")
+    write_to_log_lazy("Patching community FastMCP tool manager for server %d", id(server))
 
     # Add get_more_tools if enabled
     if data.options.enable_report_missing:
         try:
-            async def get_more_tools(context: str) -> str:
-                """Check for additional tools whenever your task might benefit from specialized capabilities."""
-                result = await handle_report_missing({"context": context})
-                if result.content:
-                    return result.content[0].text
-                return "No additional tools available"
-
             server.tool(
-                get_more_tools,
+                _get_more_tools,
                 name="get_more_tools",
-                description="Check for additional tools whenever your task might benefit from specialized capabilities - even if existing tools could work as a fallback.",
+                description=_GET_MORE_TOOLS_DESCRIPTION,
             )
 
             # Force the correct schema - Pydantic's TypeAdapter can mangle
             # the type on async closures into anyOf: [string, null]
-            from mcpcat.modules.tools import GET_MORE_TOOLS_SCHEMA
             if hasattr(server._tool_manager, "_tools") and "get_more_tools" in server._tool_manager._tools:
                 server._tool_manager._tools["get_more_tools"].parameters = GET_MORE_TOOLS_SCHEMA
 
@@ -89,39 +113,55 @@ def patch_community_fastmcp_tool_manager(server: Any) -> None:
         except Exception as e:
             write_to_log(f"Error adding get_more_tools: {e}")
 
-    # Track existing tools and optionally add context parameter
+    # Track existing tools and, if context injection is enabled, add the
+    # context parameter in the same pass
+    context_enabled = data.options.enable_tool_call_context
+    context_description = data.options.custom_context_description
     if hasattr(server._tool_manager, "_tools"):
         for tool_name, tool in server._tool_manager._tools.items():
-            # Track the tool
-            if not is_tool_tracked(server._mcp_server, tool_name):
-                register_tool(server._mcp_server, tool_name)
-                mark_tool_tracked(server._mcp_server, tool_name)
-                write_to_log(f"Found existing community FastMCP tool: {tool_name}")
-
-    # Patch existing tools if context injection is enabled
-    if data.options.enable_tool_call_context:
-        patch_existing_tools(server)
+            # Errors are handled per tool so one bad tool doesn't skip the rest
+            try:
+                # Track the tool
+                if not is_tool_tracked(server._mcp_server, tool_name):
+                    register_tool(server._mcp_server, tool_name)
+                    mark_tool_tracked(server._mcp_server, tool_name)
+                    write_to_log_lazy("Found existing community FastMCP tool: %s", tool_name)
+
+                if context_enabled and tool_name != "get_more_tools":
+                    _ensure_context_parameter(tool, context_description)
+                    write_to_log_lazy("Added/updated context parameter for existing tool: %s", tool_name)
+            except Exception as e:
+                write_to_log(f"Error patching existing tool {tool_name}: {e}")
+    elif context_enabled:
+        write_to_log("No _tools dictionary found on tool manager")
+
+    # Patch add_tool so new tools get the context parameter too
+    if context_enabled:
         patch_add_tool_fn(server)
 
 
 def patch_existing_tools(server: FastMCP) -> None:
     """Modify existing tools to include the context parameter."""
-    try:
-        data = get_server_tracking_data(server._mcp_server)
-        tool_manager = server._tool_manager
-        if not hasattr(tool_manager, "_tools"):
-            write_to_log("No _tools dictionary found on tool manager")
-            return
+    data = get_server_tracking_data(server._mcp_server)
+    if not data:
+        write_to_log("WARNING: Tracking data for server not initialized. Context parameter not added.")
+        return
 
-        for tool_name, tool in tool_manager._tools.items():
-            if tool_name == "get_more_tools":
-                continue
+    tool_manager = server._tool_manager
+    if not hasattr(tool_manager, "_tools"):
+        write_to_log("No _tools dictionary found on tool manager")
+        return
 
-            _ensure_context_parameter(tool, data.options.custom_context_description)
-            write_to_log(f"Added/updated context parameter for existing tool: {tool_name}")
+    for tool_name, tool in tool_manager._tools.items():
+        if tool_name == "get_more_tools":
+            continue
 
-    except Exception as e:
-        write_to_log(f"Error patching existing tools: {e}")
+        # Errors are handled per tool so one bad tool doesn't skip the rest
+        try:
+            _ensure_context_parameter(tool, data.options.custom_context_description)
+            write_to_log_lazy("Added/updated context parameter for existing tool: %s", tool_name)
+        except Exception as e:
+            write_to_log(f"Error patching existing tool {tool_name}: {e}")
 
 
 def patch_add_tool_fn(server: FastMCP) -> None:
@@ -134,44 +174,48 @@ def patch_add_tool_fn(server: FastMCP) -> None:
         # Store original method if not already stored
         if get_original_method(method_key) is None:
             store_original_method(method_key, tool_manager.add_tool)
-            write_to_log(f"Stored original add_tool for community tool_manager {tool_manager_id}")
+            write_to_log_lazy("Stored original add_tool for community tool_manager %d", tool_manager_id)
 
         original_add_tool = get_original_method(method_key)
         if not original_add_tool:
             write_to_log("Failed to get original add_tool method")
             return
 
+        # Resolve the tracking options once at patch time rather than looking
+        # up the server's tracking data on every add_tool call
+        mcp_server = server._mcp_server
+        data = get_server_tracking_data(mcp_server)
+        context_enabled = bool(data and data.options.enable_tool_call_context)
+        context_description = (
+            data.options.custom_context_description if context_enabled else ""
+        )
+
         def patched_add_tool(tool: Any) -> Any:
             """Patched add_tool that adds context parameter to new tools."""
-            try:
-                # Call original method first
-                result = original_add_tool(tool)
+            # Register the tool exactly once; a failure here is the caller's
+            # error and must propagate, like the unpatched method
+            result = original_add_tool(tool)
 
+            try:
                 # Track the tool
-                tool_name = tool.key if hasattr(tool, "key") else (tool.name if hasattr(tool, "name") else "unknown")
-                if not is_tool_tracked(server._mcp_server, tool_name):
-                    register_tool(server._mcp_server, tool_name)
-                    mark_tool_tracked(server._mcp_server, tool_name)
-                    write_to_log(f"Tracked new community FastMCP tool: {tool_name}")
+                tool_name = getattr(tool, "key", None) or getattr(tool, "name", None) or "unknown"
+                if not is_tool_tracked(mcp_server, tool_name):
+                    register_tool(mcp_server, tool_name)
+                    mark_tool_tracked(mcp_server, tool_name)
+                    write_to_log_lazy("Tracked new community FastMCP tool: %s", tool_name)
 
                 # Add context parameter if it's not get_more_tools
-                if tool_name != "get_more_tools":
-                    data = get_server_tracking_data(server._mcp_server)
-                    if data and data.options.enable_tool_call_context:
-                        _ensure_context_parameter(tool, data.options.custom_context_description)
-                        write_to_log(f"Added/updated context parameter for new tool: {tool_name}")
-
-                return result
+                if context_enabled and tool_name != "get_more_tools":
+                    _ensure_context_parameter(tool, context_description)
+                    write_to_log_lazy("Added/updated context parameter for new tool: %s", tool_name)
             except Exception as e:
                 write_to_log(f"Error in patched add_tool: {e}")
-                # Fall back to original if something goes wrong
-                if callable(original_add_tool):
-                    return original_add_tool(tool)
-                return tool
+
+            return result
 
         # Apply the patch
         tool_manager.add_tool = patched_add_tool
-        write_to_log(f"Successfully patched add_tool for community tool_manager {tool_manager_id}")
+        write_to_log_lazy("Successfully patched add_tool for community tool_manager %d", tool_manager_id)
 
     except Exception as e:
         write_to_log(f"Error patching add_tool: {e}")
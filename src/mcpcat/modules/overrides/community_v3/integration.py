@@ -8,8 +8,9 @@ from typing import Annotated, Any
 
 from pydantic import Field
 
-from mcpcat.modules.logging import write_to_log
+from mcpcat.modules.logging import write_to_log, write_to_log_lazy
 from mcpcat.modules.overrides.community_v3.middleware import MCPCatMiddleware
+from mcpcat.modules.tools import handle_report_missing
 from mcpcat.types import MCPCatData
 
 
@@ -32,17 +33,17 @@ def apply_community_v3_integration(server: Any, mcpcat_data: MCPCatData) -> None
         # Insert at beginning of middleware chain (position 0)
         # This ensures MCPCat sees all requests first
         server.middleware.insert(0, middleware)
-        write_to_log(
-            f"Inserted MCPCatMiddleware at position 0 for server {id(server)}"
+        write_to_log_lazy(
+            "Inserted MCPCatMiddleware at position 0 for server %d", id(server)
         )
 
         # Register get_more_tools if enabled
         if mcpcat_data.options.enable_report_missing:
             _register_get_more_tools_v3(server, mcpcat_data)
 
-        write_to_log(
-            f"Successfully applied Community FastMCP v3 integration "
-            f"for server {id(server)}"
+        write_to_log_lazy(
+            "Successfully applied Community FastMCP v3 integration for server %d",
+            id(server),
         )
 
     except Exception as e:
@@ -50,16 +51,20 @@ def apply_community_v3_integration(server: Any, mcpcat_data: MCPCatData) -> None
         raise
 
 
-def _register_get_more_tools_v3(server: Any, mcpcat_data: MCPCatData) -> None:
-    """Register the get_more_tools tool for FastMCP v3.
+# get_more_tools doesn't depend on the server or its options, so the Tool (and
+# its pydantic schema generation) is built once and copied per server
+_get_more_tools_tool: Any = None
 
-    Args:
-        server: A Community FastMCP v3 server instance.
-        mcpcat_data: MCPCat tracking configuration.
-    """
-    from fastmcp.tools.tool import Tool
 
-    from mcpcat.modules.tools import handle_report_missing
+def _build_get_more_tools_tool() -> Any:
+    """Build the get_more_tools Tool once per process."""
+    global _get_more_tools_tool
+    if _get_more_tools_tool is not None:
+        return _get_more_tools_tool
+
+    # fastmcp is optional and this module is imported by mcpcat itself, so
+    # only import it once a v3 server is actually being tracked
+    from fastmcp.tools.tool import Tool
 
     # Define the get_more_tools function
     async def get_more_tools(
@@ -77,17 +82,28 @@ def _register_get_more_tools_v3(server: Any, mcpcat_data: MCPCatData) -> None:
             return result.content[0].text
         return "No additional tools available."
 
+    _get_more_tools_tool = Tool.from_function(
+        get_more_tools,
+        name="get_more_tools",
+        description=(
+            "Check for additional tools whenever your task might benefit from "
+            "specialized capabilities - even if existing tools could work as a "
+            "fallback."
+        ),
+    )
+    return _get_more_tools_tool
+
+
+def _register_get_more_tools_v3(server: Any, mcpcat_data: MCPCatData) -> None:
+    """Register the get_more_tools tool for FastMCP v3.
+
+    Args:
+        server: A Community FastMCP v3 server instance.
+        mcpcat_data: MCPCat tracking configuration.
+    """
     try:
-        tool = Tool.from_function(
-            get_more_tools,
-            name="get_more_tools",
-            description=(
-                "Check for additional tools whenever your task might benefit from "
-                "specialized capabilities - even if existing tools could work as a "
-                "fallback."
-            ),
-        )
-        server.add_tool(tool)
+        # Each server gets its own copy so per-server changes can't leak
+        server.add_tool(_build_get_more_tools_tool().model_copy())
         write_to_log("Registered get_more_tools using server.add_tool()")
 
     except Exception as e:
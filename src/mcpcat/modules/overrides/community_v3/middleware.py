@@ -6,7 +6,7 @@ tracking capabilities with the FastMCP v3 middleware system.
 
 from __future__ import annotations
 
-import copy
+import asyncio
 from collections.abc import Sequence
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
@@ -20,14 +20,17 @@ from mcpcat.modules.exceptions import (
     get_captured_error,
     store_captured_error,
 )
-from mcpcat.modules.identify import identify_session
-from mcpcat.modules.internal import attach_event_metadata, mark_tool_tracked, register_tool
+from mcpcat.modules.identify import identify_and_capture_client
+from mcpcat.modules.internal import (
+    attach_event_metadata,
+    mark_tool_tracked,
+    mark_tools_tracked,
+    register_tool,
+    register_tools,
+)
 from mcpcat.modules.logging import write_to_log
 from mcpcat.modules.request_extra import params_with_extra
-from mcpcat.modules.session import (
-    get_client_info_from_request_context,
-    get_server_session_id,
-)
+from mcpcat.modules.session import get_server_session_id
 from mcpcat.types import EventType, MCPCatData, UnredactedEvent
 
 if TYPE_CHECKING:
@@ -55,6 +58,12 @@ class MCPCatMiddleware:
         """
         self.mcpcat_data = mcpcat_data
         self.server = server
+        # Handlers by request method, bound once instead of per request
+        self._dispatch = {
+            "initialize": self.on_initialize,
+            "tools/call": self.on_call_tool,
+            "tools/list": self.on_list_tools,
+        }
 
     async def __call__(
         self,
@@ -62,20 +71,11 @@ class MCPCatMiddleware:
         call_next: CallNext[Any, Any],
     ) -> Any:
         """Main entry point that orchestrates the pipeline."""
-        from functools import partial
-
-        handler = call_next
-
         # Dispatch based on method
-        method = context.method
-        if method == "initialize":
-            handler = partial(self.on_initialize, call_next=handler)
-        elif method == "tools/call":
-            handler = partial(self.on_call_tool, call_next=handler)
-        elif method == "tools/list":
-            handler = partial(self.on_list_tools, call_next=handler)
-
-        return await handler(context)
+        handler = self._dispatch.get(context.method)
+        if handler is None:
+            return await call_next(context)
+        return await handler(context, call_next)
 
     async def on_initialize(
         self,
@@ -91,6 +91,10 @@ class MCPCatMiddleware:
         Returns:
             The initialize result from the next handler.
         """
+        if not self.mcpcat_data.options.enable_tracing:
+            # Nothing to record: skip session handling and event construction
+            return await call_next(context)
+
         session_id = self._get_session_id()
         params = context.message.params
 
@@ -108,16 +112,20 @@ class MCPCatMiddleware:
         # tracking data is stored with the FastMCP server as the key for v3
         request_context = self._get_request_context(context)
         try:
+            # Always called, it also caches the client info on the session
+            context_name, context_version, identity = identify_and_capture_client(
+                self.server, context.message, request_context
+            )
             if not client_name:
-                client_name, client_version = get_client_info_from_request_context(self.server, request_context)
-            else:
-                get_client_info_from_request_context(self.server, request_context)
-            identity = identify_session(self.server, context.message, request_context)
+                client_name, client_version = context_name, context_version
         except Exception as e:
             identity = None
             write_to_log(f"Non-critical error in session handling: {e}")
 
-        event = UnredactedEvent(
+        # Events are constructed without validation here; publish_event
+        # validates each one once, including client-supplied fields such as
+        # client info and user_intent (assignments are validated as they happen)
+        event = UnredactedEvent.model_construct(
             session_id=session_id,
             timestamp=datetime.now(timezone.utc),
             parameters=params_with_extra(
@@ -159,8 +167,20 @@ class MCPCatMiddleware:
         Returns:
             The tool result from the next handler.
         """
+        options = self.mcpcat_data.options
         message = context.message
         tool_name = message.name
+        should_remove_context = (
+            options.enable_tool_call_context and tool_name != "get_more_tools"
+        )
+
+        if not options.enable_tracing:
+            # Nothing to record, but the injected context argument must still
+            # be stripped before the tool sees it
+            if should_remove_context:
+                context = self._without_context_argument(context)
+            return await call_next(context)
+
         arguments = dict(message.arguments or {})
         session_id = self._get_session_id()
 
@@ -169,8 +189,9 @@ class MCPCatMiddleware:
         # tracking data is stored with the FastMCP server as the key for v3
         request_context = self._get_request_context(context)
         try:
-            client_name, client_version = get_client_info_from_request_context(self.server, request_context)
-            identity = identify_session(self.server, context.message, request_context)
+            client_name, client_version, identity = identify_and_capture_client(
+                self.server, context.message, request_context
+            )
         except Exception as e:
             client_name, client_version = None, None
             identity = None
@@ -179,19 +200,14 @@ class MCPCatMiddleware:
         register_tool(self.server, tool_name)
         mark_tool_tracked(self.server, tool_name)
 
-        # Extract user intent and determine if we should remove context from arguments
+        # Extract user intent, removing context from arguments if needed
         user_intent = None
-        should_remove_context = (
-            self.mcpcat_data.options.enable_tool_call_context
-            and tool_name != "get_more_tools"
-        )
-
         if tool_name == "get_more_tools":
             user_intent = arguments.get("context")
         elif should_remove_context:
             user_intent = arguments.pop("context", None)
 
-        event = UnredactedEvent(
+        event = UnredactedEvent.model_construct(
             session_id=session_id,
             timestamp=datetime.now(timezone.utc),
             parameters=params_with_extra(
@@ -212,15 +228,10 @@ class MCPCatMiddleware:
 
         # Create modified context without context parameter if needed
         call_context = context
-        if should_remove_context and "context" in (message.arguments or {}):
-            modified_args = {
-                k: v for k, v in (message.arguments or {}).items() if k != "context"
-            }
-            modified_message = mt.CallToolRequestParams(
-                name=tool_name,
-                arguments=modified_args or None,
-            )
-            call_context = context.copy(message=modified_message)
+        if should_remove_context:
+            # arguments already has context popped; copied so the event's
+            # parameters and the downstream call don't share one dict
+            call_context = self._without_context_argument(context, dict(arguments))
 
         clear_captured_error()
 
@@ -261,6 +272,10 @@ class MCPCatMiddleware:
         Returns:
             The list of tools, potentially modified with context parameter.
         """
+        if not self.mcpcat_data.options.enable_tracing:
+            # Nothing to record, but tools must still get the context parameter
+            return self._prepare_tools(list(await call_next(context)))
+
         session_id = self._get_session_id()
 
         # Handle session identification
@@ -268,8 +283,9 @@ class MCPCatMiddleware:
         # tracking data is stored with the FastMCP server as the key for v3
         request_context = self._get_request_context(context)
         try:
-            client_name, client_version = get_client_info_from_request_context(self.server, request_context)
-            identity = identify_session(self.server, context.message, request_context)
+            client_name, client_version, identity = identify_and_capture_client(
+                self.server, context.message, request_context
+            )
         except Exception as e:
             client_name, client_version = None, None
             identity = None
@@ -277,7 +293,7 @@ class MCPCatMiddleware:
 
         params = getattr(context.message, "params", None)
 
-        event = UnredactedEvent(
+        event = UnredactedEvent.model_construct(
             session_id=session_id,
             timestamp=datetime.now(timezone.utc),
             parameters=params_with_extra(
@@ -295,15 +311,7 @@ class MCPCatMiddleware:
         await attach_event_metadata(event, self.mcpcat_data, context.message, request_context)
 
         try:
-            tools = list(await call_next(context))
-
-            for tool in tools:
-                register_tool(self.server, tool.name)
-                mark_tool_tracked(self.server, tool.name)
-
-            if self.mcpcat_data.options.enable_tool_call_context:
-                tools = self._inject_context_into_tools(tools)
-
+            tools = self._prepare_tools(list(await call_next(context)))
             event.response = {"tools": [self._tool_to_dict(t) for t in tools]}
             return tools
 
@@ -315,6 +323,50 @@ class MCPCatMiddleware:
         finally:
             self._publish_event(event, "list_tools")
 
+    def _without_context_argument(
+        self,
+        context: MiddlewareContext[mt.CallToolRequestParams],
+        arguments: dict[str, Any] | None = None,
+    ) -> MiddlewareContext[mt.CallToolRequestParams]:
+        """Return the tool call context with the 'context' argument removed.
+
+        Args:
+            context: The middleware context containing the tool call request.
+            arguments: The arguments without 'context', if already computed.
+
+        Returns:
+            A copy of the context without the argument, or the context itself
+            if the argument isn't present.
+        """
+        message = context.message
+        if not message.arguments or "context" not in message.arguments:
+            return context
+
+        if arguments is None:
+            arguments = {k: v for k, v in message.arguments.items() if k != "context"}
+        # model_copy skips re-validating the request and keeps its other
+        # fields (e.g. _meta); context.copy() is a shallow dataclass replace
+        modified_message = message.model_copy(update={"arguments": arguments or None})
+        return context.copy(message=modified_message)
+
+    def _prepare_tools(self, tools: list[Tool]) -> list[Tool]:
+        """Register listed tools and inject the context parameter if enabled.
+
+        Args:
+            tools: The tools returned by the next handler.
+
+        Returns:
+            The tools, with context parameter injected if enabled.
+        """
+        names = [tool.name for tool in tools]
+        register_tools(self.server, names)
+        mark_tools_tracked(self.server, names)
+
+        if self.mcpcat_data.options.enable_tool_call_context:
+            tools = self._inject_context_into_tools(tools)
+
+        return tools
+
     def _get_session_id(self) -> str:
         """Get the session ID for tracking.
 
@@ -343,6 +395,10 @@ class MCPCatMiddleware:
     def _publish_event(self, event: UnredactedEvent, event_name: str) -> None:
         """Publish an event if tracing is enabled.
 
+        Publishing is scheduled on the event loop rather than done inline, so
+        the response isn't held up by session lookups and queueing. The
+        duration is still measured here, when the request finished.
+
         Args:
             event: The event to publish.
             event_name: Human-readable name for error logging.
@@ -350,6 +406,26 @@ class MCPCatMiddleware:
         if not self.mcpcat_data.options.enable_tracing:
             return
 
+        if not event.duration and event.timestamp:
+            event.duration = int(
+                (datetime.now(timezone.utc) - event.timestamp).total_seconds() * 1000
+            )
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._publish_event_now(event, event_name)
+            return
+        # call_soon runs the callback in a copy of the current context
+        loop.call_soon(self._publish_event_now, event, event_name)
+
+    def _publish_event_now(self, event: UnredactedEvent, event_name: str) -> None:
+        """Hand an event to the event queue. Never raises.
+
+        Args:
+            event: The event to publish.
+            event_name: Human-readable name for error logging.
+        """
         try:
             event_queue.publish_event(self.server, event)
         except Exception as e:
@@ -380,6 +456,9 @@ class MCPCatMiddleware:
             List of tools with context parameter injected.
         """
         context_description = self.mcpcat_data.options.custom_context_description
+        # Built once per listing and shared by the tools in this response
+        # (existing context properties are copied before being updated)
+        context_property = {"type": "string", "description": context_description}
         modified_tools = []
 
         for tool in tools:
@@ -387,52 +466,71 @@ class MCPCatMiddleware:
                 modified_tools.append(tool)
                 continue
 
+            params = self._copy_parameters_schema(tool)
+            self._add_context_property(params, context_description, context_property)
+            self._add_to_required(params, "context")
+
             try:
-                tool_copy = copy.deepcopy(tool)
+                # Only the parameters schema changes, so the rest of the tool
+                # is shared with the original instead of deep-copied
+                tool_copy = tool.model_copy(update={"parameters": params})
             except Exception as e:
                 write_to_log(f"Error copying tool {tool.name}: {e}")
                 modified_tools.append(tool)
                 continue
 
-            params = self._ensure_parameters_schema(tool_copy)
-            self._add_context_property(params, context_description)
-            self._add_to_required(params, "context")
-
             modified_tools.append(tool_copy)
 
         return modified_tools
 
-    def _ensure_parameters_schema(self, tool: Tool) -> dict[str, Any]:
-        """Ensure tool has a valid parameters schema and return it.
+    def _copy_parameters_schema(self, tool: Tool) -> dict[str, Any]:
+        """Copy the parts of a tool's parameters schema that injection modifies.
+
+        The schema dict, its properties dict, an existing context property and
+        the required list are copied; nested property schemas are shared.
 
         Args:
-            tool: The tool to check/modify.
+            tool: The tool whose schema to copy.
 
         Returns:
-            The parameters dict (created if necessary).
+            The copied parameters dict (a new empty schema if the tool has none).
         """
-        if not hasattr(tool, "parameters") or tool.parameters is None:
-            tool.parameters = {"type": "object", "properties": {}, "required": []}
+        parameters = getattr(tool, "parameters", None)
+        if parameters is None:
+            return {"type": "object", "properties": {}, "required": []}
+
+        params = dict(parameters)
+        properties = dict(params.get("properties", {}))
+        if isinstance(properties.get("context"), dict):
+            properties["context"] = dict(properties["context"])
+        params["properties"] = properties
 
-        params = tool.parameters
-        if "properties" not in params:
-            params["properties"] = {}
+        required = params.get("required")
+        if isinstance(required, list):
+            params["required"] = list(required)
 
         return params
 
     def _add_context_property(
-        self, params: dict[str, Any], description: str
+        self,
+        params: dict[str, Any],
+        description: str,
+        context_property: dict[str, Any] | None = None,
     ) -> None:
         """Add or update the context property in a parameters schema.
 
         Args:
             params: The parameters dict to modify.
             description: The description for the context property.
+            context_property: Property schema to add if the tool has none,
+                shared between tools; built from *description* if omitted.
         """
         properties = params["properties"]
 
         if "context" not in properties:
-            properties["context"] = {"type": "string", "description": description}
+            if context_property is None:
+                context_property = {"type": "string", "description": description}
+            properties["context"] = context_property
         elif not properties["context"].get("description"):
             properties["context"]["description"] = description
 
@@ -8,7 +8,7 @@ from mcp.shared.context import RequestContext
 
 from mcpcat.modules import event_queue
 from mcpcat.modules.compatibility import is_mcp_error_response
-from mcpcat.modules.identify import identify_session
+from mcpcat.modules.identify import identify_and_capture_client, identify_session
 from mcpcat.modules.internal import attach_event_metadata
 from mcpcat.modules.logging import write_to_log
 from mcpcat.modules.request_extra import params_with_extra
@@ -81,8 +81,9 @@ def override_lowlevel_mcp_server(server: Server, data: MCPCatData) -> None:
         """Intercept list_tools requests to add MCPCat tools and modify existing ones."""
         session_id = get_server_session_id(server)
         request_context = safe_request_context(server)
-        client_name, client_version = get_client_info_from_request_context(server, request_context)
-        identity = identify_session(server, request, request_context)
+        client_name, client_version, identity = identify_and_capture_client(
+            server, request, request_context
+        )
 
         event = UnredactedEvent(
             session_id=session_id,
@@ -167,8 +168,9 @@ def override_lowlevel_mcp_server(server: Server, data: MCPCatData) -> None:
         arguments = request.params.arguments or {}
         session_id = get_server_session_id(server)
         request_context = safe_request_context(server)
-        client_name, client_version = get_client_info_from_request_context(server, request_context)
-        identity = identify_session(server, request, request_context)
+        client_name, client_version, identity = identify_and_capture_client(
+            server, request, request_context
+        )
 
         write_to_log(
             f"Intercepted call to tool '{tool_name}' with arguments: {arguments} and request context: {request_context}"
@@ -296,8 +298,9 @@ def override_lowlevel_mcp_server_minimal(server: Server, data: MCPCatData) -> No
         """Intercept list_tools requests to track the event (tool modifications handled by monkey-patch)."""
         session_id = get_server_session_id(server)
         request_context = safe_request_context(server)
-        client_name, client_version = get_client_info_from_request_context(server, request_context)
-        identity = identify_session(server, request, request_context)
+        client_name, client_version, identity = identify_and_capture_client(
+            server, request, request_context
+        )
 
         event = UnredactedEvent(
             session_id=session_id,
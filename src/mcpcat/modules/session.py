@@ -15,6 +15,9 @@ from ..types import MCPCatData, SessionInfo
 from ..utils import generate_prefixed_ksuid
 
 
+_INACTIVITY_TIMEOUT = timedelta(minutes=INACTIVITY_TIMEOUT_IN_MINUTES)
+
+
 def new_session_id() -> str:
     """Generate a new session ID."""
     return generate_prefixed_ksuid(SESSION_ID_PREFIX)
@@ -57,12 +60,15 @@ def get_headers_from_request_context(
 
 
 def get_client_info_from_request_context(
-    server: Server, request_context: RequestContext | None
+    server: Server,
+    request_context: RequestContext | None,
+    data: MCPCatData | None = None,
 ) -> tuple[str | None, str | None]:
     """Extract client information from request context or HTTP headers.
 
     Returns (client_name, client_version). In stateless mode, extracts per-request
-    without caching. In stateful mode, caches on shared session_info.
+    without caching. In stateful mode, caches on shared session_info. *data* is
+    the server's tracking data if the caller already looked it up.
 
     This function is designed to be resilient and never fail - any error is logged
     but won't affect the server operation.
@@ -73,7 +79,8 @@ def get_client_info_from_request_context(
         return (None, None)
 
     try:
-        data = get_server_tracking_data(server)
+        if data is None:
+            data = get_server_tracking_data(server)
         if not data:
             return (None, None)
 
@@ -189,12 +196,12 @@ def get_server_session_id(server: Server) -> str | None:
     if data.is_stateless:
         return None
 
+    # This runs on every request: the tracking data is looked up once and
+    # updated in place (it is the stored object), and the clock is read once
     now = datetime.now(timezone.utc)
-    timeout = timedelta(minutes=INACTIVITY_TIMEOUT_IN_MINUTES)
     # If last activity timed out
-    if now - data.last_activity > timeout:
+    if now - data.last_activity > _INACTIVITY_TIMEOUT:
         data.session_id = new_session_id()
-        set_server_tracking_data(server, data)
-    set_last_activity(server)
+    data.last_activity = now
 
     return data.session_id
@@ -9,6 +9,8 @@ unchanged.
 from datetime import date, datetime
 from typing import Any, TYPE_CHECKING
 
+from pydantic_core import to_json
+
 if TYPE_CHECKING:
     from mcpcat.types import UnredactedEvent
 
@@ -26,102 +28,223 @@ TRUNCATABLE_FIELDS = {"parameters", "response", "error", "identify_data", "user_
 
 def _truncate_string(value: str, max_bytes: int = MAX_STRING_BYTES) -> str:
     """Truncate a string if its UTF-8 byte size exceeds *max_bytes*."""
-    byte_size = len(value.encode("utf-8"))
+    # A code point is at most 4 UTF-8 bytes, and ASCII is exactly one byte
+    # per character, so most strings are sized without encoding them
+    if len(value) * 4 <= max_bytes:
+        return value
+    if value.isascii():
+        encoded: str | bytes = value
+    else:
+        encoded = value.encode("utf-8")
+    byte_size = len(encoded)
     if byte_size <= max_bytes:
         return value
 
+    # The marker is ASCII, so its length is its byte size
     marker = f"[string truncated by MCPcat from {byte_size} bytes]"
-    marker_bytes = len(marker.encode("utf-8"))
-    keep_bytes = max_bytes - marker_bytes
+    keep_bytes = max_bytes - len(marker)
 
     if keep_bytes <= 0:
         return marker
 
-    truncated = value.encode("utf-8")[:keep_bytes].decode("utf-8", errors="ignore")
+    truncated = encoded[:keep_bytes]
+    if isinstance(truncated, bytes):
+        truncated = truncated.decode("utf-8", errors="ignore")
     return truncated + marker
 
 
+_SCALAR_TYPES = (bool, int, float, datetime, date)
+_CONTAINER_TYPES = (dict, list, tuple)
+_DONE = object()
+
+# Exact types known to be (or not be) containers, so the walk usually decides
+# with one set lookup instead of isinstance checks; subclasses fall back to
+# isinstance
+_EXACT_CONTAINER_TYPES = frozenset(_CONTAINER_TYPES)
+_EXACT_LEAF_TYPES = frozenset({str, type(None), *_SCALAR_TYPES})
+
+
 def _truncate_value(
     value: Any,
     *,
     max_depth: int = MAX_DEPTH,
     max_string_bytes: int = MAX_STRING_BYTES,
     max_breadth: int = MAX_BREADTH,
-    _depth: int = 0,
-    _seen: set[int] | None = None,
 ) -> Any:
-    """Recursively walk a value and apply truncation limits."""
-    if value is None or isinstance(value, (bool, int, float, datetime, date)):
-        return value
+    """Walk a value and apply truncation limits. Never mutates *value*."""
+    return _truncate_tree(value, max_depth, max_string_bytes, max_breadth)
+
 
+def _truncate_leaf(value: Any, depth: int, max_depth: int, max_string_bytes: int) -> Any:
+    """Truncate a non-container value found at *depth*."""
+    if type(value) is str:
+        return _truncate_string(value, max_bytes=max_string_bytes)
+    if value is None or isinstance(value, _SCALAR_TYPES):
+        return value
     if isinstance(value, str):
         return _truncate_string(value, max_bytes=max_string_bytes)
+    if depth >= max_depth:
+        return f"[nested content truncated by MCPcat at depth {max_depth}]"
+    # Fallback for unknown types — repr and truncate
+    return _truncate_string(repr(value), max_bytes=max_string_bytes)
 
-    if _seen is None:
-        _seen = set()
 
-    obj_id = id(value)
-    if obj_id in _seen:
-        return "[circular reference]"
+def _truncate_tree(
+    value: Any, max_depth: int, max_string_bytes: int, max_breadth: int
+) -> Any:
+    """Iterative depth-first truncation using an explicit stack.
 
-    _seen.add(obj_id)
-    try:
-        at_depth_limit = _depth >= max_depth
-
-        if isinstance(value, dict):
-            items = list(value.items())
-            result = {}
-            for i, (k, v) in enumerate(items):
-                if i >= max_breadth:
-                    remaining = len(items) - max_breadth
-                    result["__truncated__"] = (
-                        f"[... {remaining} more items truncated by MCPcat]"
-                    )
-                    break
-                if at_depth_limit and isinstance(v, (dict, list, tuple)):
-                    result[str(k)] = f"[nested content truncated by MCPcat at depth {max_depth}]"
-                else:
-                    result[str(k)] = _truncate_value(
-                        v, max_depth=max_depth, max_string_bytes=max_string_bytes,
-                        max_breadth=max_breadth,
-                        _depth=_depth + 1, _seen=_seen,
-                    )
-            return result
-
-        if isinstance(value, (list, tuple)):
-            if at_depth_limit:
-                return f"[nested content truncated by MCPcat at depth {max_depth}]"
-            result_list = [
-                _truncate_value(
-                    item, max_depth=max_depth, max_string_bytes=max_string_bytes,
-                    max_breadth=max_breadth,
-                    _depth=_depth + 1, _seen=_seen,
+    Each container on the stack is a frame of (enumerated items, result,
+    source id, depth, source length). Result containers are attached to their
+    parent when opened and filled as their frame is processed, so the walk
+    needs no Python recursion. Only containers on the current path count for
+    circular reference detection, exactly as with a recursive walk.
+    """
+    depth_marker = f"[nested content truncated by MCPcat at depth {max_depth}]"
+    path: set[int] = set()
+    stack: list[tuple[Any, Any, int, int, int]] = []
+
+    def open_container(container: Any, depth: int) -> Any:
+        obj_id = id(container)
+        if obj_id in path:
+            return "[circular reference]"
+        if isinstance(container, dict):
+            if depth >= max_depth:
+                # Every nested child becomes a marker, so build it directly
+                return dict_at_depth_limit(container, depth)
+            # Empty containers are common in payloads and have nothing to
+            # walk, so they skip the frame and path bookkeeping
+            if not container:
+                return {}
+            result: Any = {}
+            items: Any = enumerate(container.items())
+        else:
+            if depth >= max_depth:
+                return depth_marker
+            if not container:
+                return []
+            result = []
+            items = enumerate(container)
+        path.add(obj_id)
+        stack.append((items, result, obj_id, depth, len(container)))
+        return result
+
+    def dict_at_depth_limit(container: dict, depth: int) -> dict:
+        result: dict[str, Any] = {}
+        for index, (key, child) in enumerate(container.items()):
+            if index >= max_breadth:
+                result["__truncated__"] = (
+                    f"[... {len(container) - max_breadth} more items truncated by MCPcat]"
                 )
-                for i, item in enumerate(value)
-                if i < max_breadth
-            ]
-            if len(value) > max_breadth:
-                remaining = len(value) - max_breadth
-                result_list.append(
-                    f"[... {remaining} more items truncated by MCPcat]"
+                break
+            key = key if type(key) is str else str(key)
+            child_type = type(child)
+            if child_type in _EXACT_CONTAINER_TYPES or (
+                child_type not in _EXACT_LEAF_TYPES
+                and isinstance(child, _CONTAINER_TYPES)
+            ):
+                result[key] = depth_marker
+            else:
+                result[key] = _truncate_leaf(
+                    child, depth + 1, max_depth, max_string_bytes
                 )
-            return result_list
+        return result
+
+    if not isinstance(value, _CONTAINER_TYPES):
+        return _truncate_leaf(value, 0, max_depth, max_string_bytes)
+    root = open_container(value, 0)
+
+    while stack:
+        items, result, obj_id, depth, length = stack[-1]
+        item = next(items, _DONE)
+        if item is _DONE:
+            stack.pop()
+            path.discard(obj_id)
+            continue
+
+        index, item = item
+        is_dict = type(result) is dict
+        if index >= max_breadth:
+            # Breadth limit reached: note what was left out, close the frame
+            marker = f"[... {length - max_breadth} more items truncated by MCPcat]"
+            if is_dict:
+                result["__truncated__"] = marker
+            else:
+                result.append(marker)
+            stack.pop()
+            path.discard(obj_id)
+            continue
+
+        child = item[1] if is_dict else item
+        child_depth = depth + 1
+        child_type = type(child)
+        if child_type in _EXACT_CONTAINER_TYPES or (
+            child_type not in _EXACT_LEAF_TYPES
+            and isinstance(child, _CONTAINER_TYPES)
+        ):
+            # Frames are never opened at the depth limit, so this descends
+            new_child = open_container(child, child_depth)
+        else:
+            new_child = _truncate_leaf(
+                child, child_depth, max_depth, max_string_bytes
+            )
+
+        if is_dict:
+            # Keys are almost always str already, so skip the str() call
+            key = item[0]
+            result[key if type(key) is str else str(key)] = new_child
+        else:
+            result.append(new_child)
+
+    return root
 
-        if at_depth_limit:
-            return f"[nested content truncated by MCPcat at depth {max_depth}]"
 
-        # Fallback for unknown types — repr and truncate
-        return _truncate_string(repr(value), max_bytes=max_string_bytes)
-    finally:
-        _seen.discard(obj_id)
+def _tightening_schedule() -> tuple[tuple[int, int, int], ...]:
+    """Return the (depth, string bytes, breadth) limits of each truncation pass.
+
+    Each pass halves the per-string byte limit and reduces depth until
+    MIN_DEPTH, after which breadth is halved instead.
+    """
+    passes = []
+    depth, string_bytes, breadth = MAX_DEPTH, MAX_STRING_BYTES, MAX_BREADTH
+    while string_bytes >= 1:
+        passes.append((depth, string_bytes, breadth))
+        if depth > MIN_DEPTH:
+            depth -= 1
+        string_bytes //= 2
+        if depth <= MIN_DEPTH and breadth > 1:
+            breadth //= 2
+    return tuple(passes)
+
+
+_TRUNCATION_PASSES = _tightening_schedule()
+
+
+def _truncate_fields(
+    event_dict: dict[str, Any], depth: int, string_bytes: int, breadth: int
+) -> dict[str, Any]:
+    """Return a copy of *event_dict* with its truncatable fields truncated."""
+    candidate_dict = dict(event_dict)
+    for field_name in TRUNCATABLE_FIELDS:
+        if field_name in candidate_dict and candidate_dict[field_name] is not None:
+            if isinstance(candidate_dict[field_name], str):
+                candidate_dict[field_name] = _truncate_string(candidate_dict[field_name], max_bytes=string_bytes)
+            else:
+                candidate_dict[field_name] = _truncate_value(
+                    candidate_dict[field_name],
+                    max_depth=depth,
+                    max_string_bytes=string_bytes,
+                    max_breadth=breadth,
+                )
+    return candidate_dict
 
 
 def truncate_event(event: "UnredactedEvent | None") -> "UnredactedEvent | None":
     """Return a truncated copy of *event* if it exceeds MAX_EVENT_BYTES.
 
     Uses size-targeted normalization strategy: normalize with the
-    current limits, check JSON byte size, and if still over the limit tighten
-    limits and re-normalize until it fits.
+    default limits, check JSON byte size, and if still over the limit search
+    the tightening schedule for the loosest limits that fit.
 
     Each pass halves the per-string byte limit and (once MIN_DEPTH is reached)
     reduces breadth. Depth never goes below MIN_DEPTH to avoid replacing
@@ -136,8 +259,14 @@ def truncate_event(event: "UnredactedEvent | None") -> "UnredactedEvent | None":
         return None
 
     try:
-        serialized_bytes = event.model_dump_json().encode("utf-8")
-        byte_size = len(serialized_bytes)
+        # Only the truncatable fields can be shrunk, so an event where they are
+        # all unset or empty is returned as-is without serializing it
+        if not any(getattr(event, name, None) for name in TRUNCATABLE_FIELDS):
+            return event
+
+        # to_json returns the same bytes as model_dump_json().encode("utf-8")
+        # without the decode/encode round trip
+        byte_size = len(to_json(event))
         if byte_size <= MAX_EVENT_BYTES:
             return event
 
@@ -147,42 +276,56 @@ def truncate_event(event: "UnredactedEvent | None") -> "UnredactedEvent | None":
         )
 
         event_cls = type(event)
-        depth = MAX_DEPTH
-        string_bytes = MAX_STRING_BYTES
-        breadth = MAX_BREADTH
-        candidate = None
-
-        while string_bytes >= 1:
-            # Always start from a fresh dump to avoid compounding artifacts
-            event_dict = event.model_dump()
-            for field_name in TRUNCATABLE_FIELDS:
-                if field_name in event_dict and event_dict[field_name] is not None:
-                    if isinstance(event_dict[field_name], str):
-                        event_dict[field_name] = _truncate_string(event_dict[field_name], max_bytes=string_bytes)
-                    else:
-                        event_dict[field_name] = _truncate_value(
-                            event_dict[field_name],
-                            max_depth=depth,
-                            max_string_bytes=string_bytes,
-                            max_breadth=breadth,
-                        )
-            candidate = event_cls.model_validate(event_dict)
-            result_bytes = len(candidate.model_dump_json().encode("utf-8"))
+        # Dumped once: truncation never mutates its input, so every pass can
+        # start from the same dump without compounding artifacts
+        event_dict = event.model_dump()
+
+        def attempt(limits: tuple[int, int, int]) -> tuple[dict[str, Any], "UnredactedEvent | None"]:
+            depth, string_bytes, breadth = limits
+            candidate_dict = _truncate_fields(event_dict, depth, string_bytes, breadth)
+            # Size the plain dict first and only build (validate) a model for
+            # passes that look small enough; the model's own size is decisive
+            result_bytes = len(to_json(candidate_dict))
             if result_bytes <= MAX_EVENT_BYTES:
-                return candidate
+                candidate = event_cls.model_validate(candidate_dict)
+                result_bytes = len(to_json(candidate))
+                if result_bytes <= MAX_EVENT_BYTES:
+                    return candidate_dict, candidate
             write_to_log(
                 f"Event still {result_bytes} bytes at depth={depth} "
                 f"string_limit={string_bytes} breadth={breadth}, tightening limits"
             )
-            # Tighten: reduce depth (down to MIN_DEPTH), halve string limit
-            if depth > MIN_DEPTH:
-                depth -= 1
-            string_bytes //= 2
-            # Breadth reduction as fallback once depth is at minimum
-            if depth <= MIN_DEPTH and breadth > 1:
-                breadth //= 2
-
-        return candidate
+            return candidate_dict, None
+
+        # The default limits are usually enough, so they are tried first
+        _, fitted = attempt(_TRUNCATION_PASSES[0])
+        if fitted is not None:
+            return fitted
+
+        lo, hi = 1, len(_TRUNCATION_PASSES) - 1
+        candidate_dict, fitted = attempt(_TRUNCATION_PASSES[hi])
+        if fitted is None:
+            # Sizes aren't monotone once limits drop below the marker length
+            # (short strings and containers grow into markers), so a looser
+            # pass may still fit: try each in turn, as the loop always did
+            for limits in _TRUNCATION_PASSES[1:hi]:
+                _, fitted = attempt(limits)
+                if fitted is not None:
+                    return fitted
+            # Limits exhausted: return the most truncated candidate
+            return event_cls.model_validate(candidate_dict)
+
+        # Tighter limits shrink the output, so binary-search the schedule for
+        # the loosest pass that fits instead of trying each in turn. Every
+        # candidate returned has been measured, so the result always fits
+        while lo < hi:
+            mid = (lo + hi) // 2
+            _, candidate = attempt(_TRUNCATION_PASSES[mid])
+            if candidate is not None:
+                fitted, hi = candidate, mid
+            else:
+                lo = mid + 1
+        return fitted
 
     except Exception as e:
         write_to_log(f"WARNING: Truncation failed for event {event.id or 'unknown'}: {e}")
@@ -8,6 +8,7 @@ from mcpcat.modules.constants import DEFAULT_CONTEXT_DESCRIPTION
 from ..test_utils.community_client import create_community_test_client
 from ..test_utils.community_todo_server import (
     HAS_COMMUNITY_FASTMCP,
+    IS_FASTMCP_V3,
     create_community_todo_server,
 )
 
@@ -578,6 +579,69 @@ class TestCommunityToolContext:
             )
             assert "Dynamic result: test" in str(result)
 
+    def test_ensure_context_parameter_is_idempotent(self):
+        """Re-applying the same description leaves the schema untouched."""
+        from types import SimpleNamespace
+
+        from mcpcat.modules.overrides.community.tool_manager import (
+            _ensure_context_parameter,
+        )
+
+        tool = SimpleNamespace(parameters={"type": "object", "properties": {}})
+        _ensure_context_parameter(tool, "first")
+        _ensure_context_parameter(tool, "first")
+        assert tool.parameters["required"] == ["context"]
+        assert tool.parameters["properties"]["context"]["description"] == "first"
+
+        # A changed description or replaced schema is applied again
+        _ensure_context_parameter(tool, "second")
+        assert tool.parameters["properties"]["context"]["description"] == "second"
+        tool.parameters = {"type": "object", "properties": {}}
+        _ensure_context_parameter(tool, "second")
+        assert tool.parameters["required"] == ["context"]
+
+        # So is a schema whose 'context' property was deleted in place
+        del tool.parameters["properties"]["context"]
+        _ensure_context_parameter(tool, "second")
+        assert tool.parameters["properties"]["context"]["description"] == "second"
+
+    @pytest.mark.skipif(
+        IS_FASTMCP_V3, reason="v3 uses middleware instead of add_tool patching"
+    )
+    def test_add_tool_post_processing_error_registers_tool_once(self):
+        """A failure after registration must not call the original add_tool again."""
+        from unittest.mock import patch
+
+        server = create_community_todo_server()
+        track(server, "test_project", MCPCatOptions(enable_tool_call_context=True))
+
+        calls = []
+        original = server._tool_manager.add_tool
+
+        def counting_add_tool(tool):
+            calls.append(tool)
+            return original(tool)
+
+        with patch(
+            "mcpcat.modules.overrides.community.tool_manager._ensure_context_parameter",
+            side_effect=RuntimeError("boom"),
+        ), patch(
+            "mcpcat.modules.overrides.community.tool_manager.get_original_method",
+            return_value=counting_add_tool,
+        ):
+            from mcpcat.modules.overrides.community.tool_manager import (
+                patch_add_tool_fn,
+            )
+
+            patch_add_tool_fn(server)
+
+            @server.tool
+            def late_tool(data: str) -> str:
+                """A tool added after tracking."""
+                return data
+
+        assert len(calls) == 1
+
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
@@ -60,3 +60,26 @@ async def test_v3_event_duration_is_non_negative(v3_http_server, capture_queue):
     assert call_events
     assert call_events[0].duration is not None
     assert call_events[0].duration >= 0
+
+
+@pytest.mark.asyncio
+async def test_v3_malformed_client_context_is_not_queued(
+    v3_http_server, capture_queue
+):
+    # Events are built without validation; publish_event validates them
+    from fastmcp import Client
+    from fastmcp.client.transports import StreamableHttpTransport
+
+    url, _ = v3_http_server
+    async with Client(StreamableHttpTransport(url)) as client:
+        await client.call_tool("add_todo", {"text": "bad-intent", "context": 42})
+        await client.call_tool("add_todo", {"text": "good-intent", "context": "x"})
+
+    time.sleep(0.5)
+    call_texts = [
+        e.parameters["arguments"]["text"]
+        for e in capture_queue
+        if e.event_type == "mcp:tools/call"
+    ]
+    assert "good-intent" in call_texts
+    assert "bad-intent" not in call_texts
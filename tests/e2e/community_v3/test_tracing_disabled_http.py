@@ -0,0 +1,39 @@
+"""FastMCP v3 with tracing disabled over real HTTP."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from mcpcat import MCPCatOptions
+
+
+def MCPCAT_OPTIONS_FACTORY() -> MCPCatOptions:
+    return MCPCatOptions(enable_tracing=False, enable_tool_call_context=True)
+
+
+pytestmark = pytest.mark.e2e
+
+
+@pytest.mark.asyncio
+async def test_v3_tracing_disabled_publishes_nothing_but_keeps_context(
+    v3_http_server, capture_queue
+):
+    from fastmcp import Client
+    from fastmcp.client.transports import StreamableHttpTransport
+
+    url, _ = v3_http_server
+    async with Client(StreamableHttpTransport(url)) as client:
+        tools = await client.list_tools()
+        add_todo = next(t for t in tools if t.name == "add_todo")
+        assert "context" in add_todo.inputSchema["properties"]
+        assert "context" in add_todo.inputSchema["required"]
+
+        result = await client.call_tool(
+            "add_todo", {"text": "untraced", "context": "no tracing"}
+        )
+        assert "untraced" in result.content[0].text
+
+    time.sleep(0.5)
+    assert capture_queue == []
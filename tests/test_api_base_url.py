@@ -65,10 +65,7 @@ class TestTrackApiBaseUrl:
 
     # Common patches needed to isolate track() from real MCP server logic
     TRACK_PATCHES = [
-        "mcpcat.is_community_fastmcp_v3",
-        "mcpcat.is_community_fastmcp_v2",
-        "mcpcat.is_official_fastmcp_server",
-        "mcpcat.is_compatible_server",
+        "mcpcat.classify_server",
         "mcpcat._apply_server_tracking",
         "mcpcat.get_session_info",
         "mcpcat.set_server_tracking_data",
@@ -90,14 +87,14 @@ class TestTrackApiBaseUrl:
             for name, p in patches.items():
                 m = p.start()
                 started.append(p)
-                if name == "mcpcat.is_compatible_server":
-                    m.return_value = True
-                elif name in (
-                    "mcpcat.is_community_fastmcp_v3",
-                    "mcpcat.is_community_fastmcp_v2",
-                    "mcpcat.is_official_fastmcp_server",
-                ):
-                    m.return_value = False
+                if name == "mcpcat.classify_server":
+                    from mcpcat.modules.compatibility import ServerKind
+                    m.return_value = ServerKind(
+                        is_community_v3=False,
+                        is_community_v2=False,
+                        is_official_fastmcp=False,
+                        is_compatible=True,
+                    )
                 elif name == "mcpcat.get_session_info":
                     from mcpcat.types import SessionInfo
                     m.return_value = SessionInfo()
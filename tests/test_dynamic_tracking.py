@@ -15,6 +15,10 @@ from mcpcat.modules.internal import (
     get_server_tracking_data,
     reset_all_tracking_data,
     get_tool_timeline,
+    is_tool_tracked,
+    mark_tools_tracked,
+    register_tool,
+    register_tools,
 )
 
 
@@ -363,6 +367,26 @@ class TestDynamicTracking:
         # This is a known issue where tools from different servers
         # can appear in each other's registries
 
+    def test_register_and_mark_tools_in_batch(self, lowlevel_server):
+        """Batch registration matches the per-tool helpers."""
+        track(lowlevel_server, "test_project", MCPCatOptions())
+        data = get_server_tracking_data(lowlevel_server)
+        register_tool(lowlevel_server, "existing")
+        existing_registration = data.tool_registry["existing"]
+
+        register_tools(lowlevel_server, ["existing", "a", "b"])
+        mark_tools_tracked(lowlevel_server, ["a", "b", "unknown"])
+
+        # Already-registered tools keep their registration
+        assert data.tool_registry["existing"] is existing_registration
+        assert {"existing", "a", "b"} <= set(data.tool_registry)
+        assert is_tool_tracked(lowlevel_server, "a")
+        assert is_tool_tracked(lowlevel_server, "b")
+        assert not is_tool_tracked(lowlevel_server, "existing")
+        # Unregistered tools aren't marked
+        assert "unknown" not in data.tool_registry
+        assert not is_tool_tracked(lowlevel_server, "unknown")
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
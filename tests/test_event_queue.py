@@ -7,6 +7,9 @@ import time
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, call, patch
 
+import pytest
+from pydantic import ValidationError
+
 from mcpcat.modules.event_queue import EventQueue, publish_event
 from mcpcat.modules.logging import write_to_log
 from mcpcat.types import Event, MCPCatData, MCPCatOptions, SessionInfo, UnredactedEvent
@@ -719,6 +722,39 @@ class TestPublishEvent:
         added_event = mock_eq.add.call_args[0][0]
         assert added_event.redaction_fn == mock_redaction_fn
 
+    @patch("mcpcat.modules.event_queue.get_server_tracking_data")
+    @patch("mcpcat.modules.event_queue.get_session_info")
+    @patch("mcpcat.modules.event_queue.set_last_activity")
+    @patch("mcpcat.modules.event_queue.event_queue")
+    def test_publish_event_rejects_unvalidated_malformed_event(
+        self, mock_eq, mock_set_activity, mock_session, mock_tracking
+    ):
+        """Events built without validation are still validated before queueing."""
+        mock_server = MagicMock()
+        mock_tracking.return_value = MCPCatData(
+            project_id="project-123",
+            session_id="session-123",
+            session_info=SessionInfo(),
+            last_activity=datetime.now(timezone.utc),
+            options=MCPCatOptions(),
+        )
+        mock_session.return_value = SessionInfo()
+
+        for fields in (
+            {"event_type": "not-an-event-type"},
+            {"event_type": "mcp:tools/call", "user_intent": 42},
+            {"event_type": "mcp:tools/call", "client_name": ["not", "a", "str"]},
+        ):
+            event = UnredactedEvent.model_construct(
+                session_id="session-123",
+                timestamp=datetime.now(timezone.utc),
+                **fields,
+            )
+            with pytest.raises(ValidationError):
+                publish_event(mock_server, event)
+
+        mock_eq.add.assert_not_called()
+
 
 @patch("mcpcat.modules.event_queue.signal.signal")
 @patch("mcpcat.modules.event_queue.atexit.register")
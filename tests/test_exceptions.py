@@ -1,9 +1,10 @@
 """Tests for exception tracking functionality."""
 
+import asyncio
 import os
+import sys
 import tempfile
-import time
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import pytest
 
@@ -109,6 +110,28 @@ class TestErrorChainUnwrapping:
             assert chained[0]["message"] == "root cause"
             assert chained[0]["type"] == "ValueError"
 
+    def test_chained_stack_formats_only_its_own_traceback(self):
+        """Root stack renders the full chain; chained stacks do not repeat it."""
+        try:
+            try:
+                try:
+                    raise ValueError("level 0")
+                except ValueError as e:
+                    raise KeyError("level 1") from e
+            except KeyError as e:
+                raise RuntimeError("level 2") from e
+        except RuntimeError as e:
+            error_data = capture_exception(e)
+
+            assert "level 0" in error_data["stack"]
+            assert "level 1" in error_data["stack"]
+
+            chained = error_data["chained_errors"]
+            assert len(chained) == 2
+            assert "level 1" in chained[0]["stack"]
+            assert "level 0" not in chained[0]["stack"]
+            assert "level 0" in chained[1]["stack"]
+
     def test_implicit_chaining_context(self):
         """Test implicit exception chaining (__context__)."""
         try:
@@ -247,6 +270,18 @@ class TestPathNormalization:
         # Should fall back to original path
         assert result == path
 
+    def test_filename_for_module_caches_base_module_dir(self):
+        """Base module directories are cached once the module is imported."""
+        from mcpcat.modules.exceptions import _base_module_dirs
+
+        _base_module_dirs.pop("mcpcat", None)
+        path = sys.modules["mcpcat.modules.exceptions"].__file__
+
+        first = filename_for_module("mcpcat.modules.exceptions", path)
+        assert "mcpcat" in _base_module_dirs
+        assert filename_for_module("mcpcat.modules.exceptions", path) == first
+        assert first.endswith(os.path.join("mcpcat", "modules", "exceptions.py"))
+
 
 class TestContextExtraction:
     """Tests for source context extraction."""
@@ -438,24 +473,30 @@ class TestExceptionIntegration:
         set_event_queue(original_queue)
 
     def _create_mock_event_capture(self):
-        """Helper to create mock API client and event capture list."""
-        mock_api_client = MagicMock()
+        """Helper to create a stub API client, event capture list, and an event
+        set once a tool call has been published."""
         captured_events = []
+        tool_call_published = asyncio.Event()
+        loop = asyncio.get_running_loop()
 
         def capture_event(publish_event_request):
             captured_events.append(publish_event_request)
+            if publish_event_request.event_type == "mcp:tools/call":
+                # Published from an EventQueue worker thread
+                loop.call_soon_threadsafe(tool_call_published.set)
 
-        mock_api_client.publish_event = MagicMock(side_effect=capture_event)
+        # A plain callable: a MagicMock would record every call
+        mock_api_client = SimpleNamespace(publish_event=capture_event)
 
         test_queue = EventQueue(api_client=mock_api_client)
         set_event_queue(test_queue)
 
-        return captured_events
+        return captured_events, tool_call_published
 
     @pytest.mark.asyncio
     async def test_tool_raises_value_error(self):
         """Test that ValueError from tools is properly captured."""
-        captured_events = self._create_mock_event_capture()
+        captured_events, tool_call_published = self._create_mock_event_capture()
 
         server = create_todo_server()
         options = MCPCatOptions(enable_tracing=True)
@@ -463,7 +504,7 @@ class TestExceptionIntegration:
 
         async with create_test_client(server) as client:
             await client.call_tool("tool_that_raises", {"error_type": "value"})
-            time.sleep(1.0)
+            await asyncio.wait_for(tool_call_published.wait(), timeout=5.0)
 
         tool_events = [
             e
@@ -482,7 +523,7 @@ class TestExceptionIntegration:
     @pytest.mark.asyncio
     async def test_tool_raises_runtime_error(self):
         """Test that RuntimeError from tools is properly captured."""
-        captured_events = self._create_mock_event_capture()
+        captured_events, tool_call_published = self._create_mock_event_capture()
 
         server = create_todo_server()
         options = MCPCatOptions(enable_tracing=True)
@@ -490,7 +531,7 @@ class TestExceptionIntegration:
 
         async with create_test_client(server) as client:
             await client.call_tool("tool_that_raises", {"error_type": "runtime"})
-            time.sleep(1.0)
+            await asyncio.wait_for(tool_call_published.wait(), timeout=5.0)
 
         tool_events = [
             e
@@ -509,7 +550,7 @@ class TestExceptionIntegration:
     @pytest.mark.asyncio
     async def test_tool_raises_custom_error(self):
         """Test that custom exception types are properly captured."""
-        captured_events = self._create_mock_event_capture()
+        captured_events, tool_call_published = self._create_mock_event_capture()
 
         server = create_todo_server()
         options = MCPCatOptions(enable_tracing=True)
@@ -517,7 +558,7 @@ class TestExceptionIntegration:
 
         async with create_test_client(server) as client:
             await client.call_tool("tool_that_raises", {"error_type": "custom"})
-            time.sleep(1.0)
+            await asyncio.wait_for(tool_call_published.wait(), timeout=5.0)
 
         tool_events = [
             e
@@ -536,7 +577,7 @@ class TestExceptionIntegration:
     @pytest.mark.asyncio
     async def test_tool_raises_captures_stack_frames(self):
         """Test that stack frames are properly captured with correct structure."""
-        captured_events = self._create_mock_event_capture()
+        captured_events, tool_call_published = self._create_mock_event_capture()
 
         server = create_todo_server()
         options = MCPCatOptions(enable_tracing=True)
@@ -544,7 +585,7 @@ class TestExceptionIntegration:
 
         async with create_test_client(server) as client:
             await client.call_tool("tool_that_raises", {"error_type": "value"})
-            time.sleep(1.0)
+            await asyncio.wait_for(tool_call_published.wait(), timeout=5.0)
 
         tool_events = [
             e
@@ -575,7 +616,7 @@ class TestExceptionIntegration:
     @pytest.mark.asyncio
     async def test_tool_raises_has_in_app_frames(self):
         """Test that stack frames include in_app detection."""
-        captured_events = self._create_mock_event_capture()
+        captured_events, tool_call_published = self._create_mock_event_capture()
 
         server = create_todo_server()
         options = MCPCatOptions(enable_tracing=True)
@@ -583,7 +624,7 @@ class TestExceptionIntegration:
 
         async with create_test_client(server) as client:
             await client.call_tool("tool_that_raises", {"error_type": "value"})
-            time.sleep(1.0)
+            await asyncio.wait_for(tool_call_published.wait(), timeout=5.0)
 
         tool_events = [
             e
@@ -609,7 +650,7 @@ class TestExceptionIntegration:
     @pytest.mark.asyncio
     async def test_tool_raises_captures_context_lines(self):
         """Test that context lines are captured for in_app frames."""
-        captured_events = self._create_mock_event_capture()
+        captured_events, tool_call_published = self._create_mock_event_capture()
 
         server = create_todo_server()
         options = MCPCatOptions(enable_tracing=True)
@@ -617,7 +658,7 @@ class TestExceptionIntegration:
 
         async with create_test_client(server) as client:
             await client.call_tool("tool_that_raises", {"error_type": "value"})
-            time.sleep(1.0)
+            await asyncio.wait_for(tool_call_published.wait(), timeout=5.0)
 
         tool_events = [
             e
@@ -644,7 +685,7 @@ class TestExceptionIntegration:
     @pytest.mark.asyncio
     async def test_mcp_protocol_error(self):
         """Test that MCP protocol errors (McpError) are properly handled."""
-        captured_events = self._create_mock_event_capture()
+        captured_events, tool_call_published = self._create_mock_event_capture()
 
         server = create_todo_server()
         options = MCPCatOptions(enable_tracing=True)
@@ -652,7 +693,7 @@ class TestExceptionIntegration:
 
         async with create_test_client(server) as client:
             await client.call_tool("tool_with_mcp_error", {})
-            time.sleep(1.0)
+            await asyncio.wait_for(tool_call_published.wait(), timeout=5.0)
 
         tool_events = [
             e
@@ -8,7 +8,7 @@ from unittest.mock import patch
 
 import pytest
 
-from mcpcat.modules.logging import write_to_log, set_debug_mode
+from mcpcat.modules.logging import flush_log, write_to_log, set_debug_mode
 
 
 class TestLogging:
@@ -38,13 +38,14 @@ class TestLogging:
         unique_id = str(uuid.uuid4())
         log_file = tmp_path / f"test_mcpcat_{unique_id}.log"
 
-        # Mock os.path.expanduser to use our temp file
+        # Point the log path at our temp file
         with patch(
-            "mcpcat.modules.logging.os.path.expanduser", return_value=str(log_file)
+            "mcpcat.modules.logging._log_path", str(log_file)
         ):
             # Write a test message
             test_message = f"Test log message {unique_id}"
             write_to_log(test_message)
+            flush_log()
 
             # Check that the file was created
             assert log_file.exists(), "Log file was not created"
@@ -67,13 +68,14 @@ class TestLogging:
         unique_id = str(uuid.uuid4())
         log_file = tmp_path / f"test_mcpcat_{unique_id}.log"
 
-        # Mock os.path.expanduser to use our temp file
+        # Point the log path at our temp file
         with patch(
-            "mcpcat.modules.logging.os.path.expanduser", return_value=str(log_file)
+            "mcpcat.modules.logging._log_path", str(log_file)
         ):
             # Write a test message
             test_message = f"Test log message {unique_id}"
             write_to_log(test_message)
+            flush_log()
 
             # Check that the file was created
             assert log_file.exists(), "Log file was not created"
@@ -94,13 +96,14 @@ class TestLogging:
         unique_id = str(uuid.uuid4())
         log_file = tmp_path / f"test_mcpcat_{unique_id}.log"
 
-        # Mock os.path.expanduser to use our temp file
+        # Point the log path at our temp file
         with patch(
-            "mcpcat.modules.logging.os.path.expanduser", return_value=str(log_file)
+            "mcpcat.modules.logging._log_path", str(log_file)
         ):
             # Write a test message
             test_message = f"Test log message {unique_id}"
             write_to_log(test_message)
+            flush_log()
 
             # Check that the file was created
             assert not log_file.exists(), "Log file was wrongly created"
@@ -114,9 +117,9 @@ class TestLogging:
         unique_id = str(uuid.uuid4())
         log_file = tmp_path / f"test_mcpcat_{unique_id}.log"
 
-        # Mock os.path.expanduser to use our temp file
+        # Point the log path at our temp file
         with patch(
-            "mcpcat.modules.logging.os.path.expanduser", return_value=str(log_file)
+            "mcpcat.modules.logging._log_path", str(log_file)
         ):
             # Write multiple messages with unique identifiers
             messages = [
@@ -127,6 +130,7 @@ class TestLogging:
             for msg in messages:
                 write_to_log(msg)
                 time.sleep(0.01)  # Small delay to ensure different timestamps
+            flush_log()
 
             # Read the file content
             content = log_file.read_text()
@@ -165,13 +169,14 @@ class TestLogging:
         unique_id = str(uuid.uuid4())
         log_file = tmp_path / f"test_mcpcat_{unique_id}.log"
 
-        # Mock os.path.expanduser to use our temp file
+        # Point the log path at our temp file
         with patch(
-            "mcpcat.modules.logging.os.path.expanduser", return_value=str(log_file)
+            "mcpcat.modules.logging._log_path", str(log_file)
         ):
             # Write a test message
             test_message = f"Test with directory creation {unique_id}"
             write_to_log(test_message)
+            flush_log()
 
             # Check that the file was created
             assert log_file.exists(), "Log file was not created"
@@ -186,9 +191,9 @@ class TestLogging:
         unique_id = str(uuid.uuid4())
         log_file = tmp_path / f"test_mcpcat_{unique_id}.log"
 
-        # Mock os.path.expanduser to use our temp file
+        # Point the log path at our temp file
         with patch(
-            "mcpcat.modules.logging.os.path.expanduser", return_value=str(log_file)
+            "mcpcat.modules.logging._log_path", str(log_file)
         ):
             # Make the parent directory read-only to cause write failure
             log_file.parent.chmod(0o444)
@@ -196,6 +201,7 @@ class TestLogging:
             try:
                 # This should not raise an exception
                 write_to_log(f"This should fail silently {unique_id}")
+                flush_log()
 
                 # If we get here without exception, the test passes
                 assert True
@@ -212,13 +218,14 @@ class TestLogging:
         unique_id = str(uuid.uuid4())
         log_file = tmp_path / f"test_mcpcat_{unique_id}.log"
 
-        # Mock os.path.expanduser to use our temp file
+        # Point the log path at our temp file
         with patch(
-            "mcpcat.modules.logging.os.path.expanduser", return_value=str(log_file)
+            "mcpcat.modules.logging._log_path", str(log_file)
         ):
             # Write a test message
             test_message = f"Test format validation {unique_id}"
             write_to_log(test_message)
+            flush_log()
 
             # Read the log entry
             content = log_file.read_text().strip()
@@ -244,3 +251,124 @@ class TestLogging:
 
             # Verify message
             assert message == test_message, "Message content doesn't match"
+
+    def test_env_debug_mode_overrides_option(self, tmp_path):
+        """MCPCAT_DEBUG_MODE keeps file logging on even if debug_mode=False."""
+        unique_id = str(uuid.uuid4())
+        log_file = tmp_path / f"test_mcpcat_{unique_id}.log"
+
+        with patch("mcpcat.modules.logging._env_debug_mode", True), patch(
+            "mcpcat.modules.logging._log_path", str(log_file)
+        ):
+            set_debug_mode(False)
+            write_to_log(f"Env override {unique_id}")
+            flush_log()
+
+        # Reset once the env override is no longer in effect
+        set_debug_mode(False)
+        assert log_file.exists(), "Log file was not created"
+
+    def test_timestamp_matches_datetime_isoformat(self):
+        """The fast timestamp formatter matches datetime's ISO output."""
+        from datetime import datetime
+
+        from mcpcat.modules.logging import _utc_timestamp
+
+        timestamp = _utc_timestamp()
+        parsed = datetime.fromisoformat(timestamp)
+        assert parsed.utcoffset().total_seconds() == 0
+        assert parsed.isoformat(timespec="microseconds") == timestamp
+
+    def test_write_to_log_lazy_formats_only_when_logged(self, tmp_path):
+        """write_to_log_lazy skips formatting when nothing consumes the entry."""
+        from mcpcat.modules.logging import write_to_log_lazy
+
+        class Exploding:
+            def __str__(self):
+                raise AssertionError("message should not be formatted")
+
+        set_debug_mode(False)
+        write_to_log_lazy("Value %s", Exploding())
+
+        log_file = tmp_path / f"test_mcpcat_{uuid.uuid4()}.log"
+        set_debug_mode(True)
+        with patch("mcpcat.modules.logging._log_path", str(log_file)):
+            write_to_log_lazy("Telemetry initialized with %d exporter(s)", 2)
+            flush_log()
+
+        assert "Telemetry initialized with 2 exporter(s)" in log_file.read_text()
+
+    def test_write_to_log_lazy_bad_format_does_not_raise_with_sink(self):
+        """A format/args mismatch is logged raw to the sink instead of raising."""
+        from mcpcat.modules.logging import set_diagnostics_sink, write_to_log_lazy
+
+        received = []
+        set_debug_mode(False)
+        set_diagnostics_sink(received.append)
+        try:
+            write_to_log_lazy("expected a number: %d", "not a number")
+        finally:
+            set_diagnostics_sink(None)
+
+        assert len(received) == 1
+        assert "expected a number: %d ('not a number',)" in received[0]
+
+    def test_entries_are_written_in_order_by_background_writer(self, tmp_path):
+        """Batched entries reach the file in the order they were logged."""
+        set_debug_mode(True)
+        log_file = tmp_path / f"test_mcpcat_{uuid.uuid4()}.log"
+
+        with patch("mcpcat.modules.logging._log_path", str(log_file)):
+            for i in range(200):
+                write_to_log(f"batched entry {i}")
+            flush_log()
+
+        lines = log_file.read_text().splitlines()
+        assert [line.split("] ", 1)[1] for line in lines] == [
+            f"batched entry {i}" for i in range(200)
+        ]
+
+    def test_refresh_debug_flag_rereads_environment(self):
+        """_refresh_debug_flag picks up MCPCAT_DEBUG_MODE changes."""
+        from mcpcat.modules import logging as mcpcat_logging
+
+        set_debug_mode(False)
+        try:
+            with patch.dict(os.environ, {"MCPCAT_DEBUG_MODE": "true"}):
+                mcpcat_logging._refresh_debug_flag()
+                assert mcpcat_logging.debug_mode is True
+            with patch.dict(os.environ, {"MCPCAT_DEBUG_MODE": "off"}):
+                mcpcat_logging._refresh_debug_flag()
+                assert mcpcat_logging.debug_mode is False
+        finally:
+            mcpcat_logging._refresh_debug_flag()
+
+    def test_percent_in_plain_message_is_not_formatted(self, tmp_path):
+        """Only write_to_log_lazy messages are %-formatted by the writer."""
+        from mcpcat.modules.logging import write_to_log_lazy
+
+        set_debug_mode(True)
+        log_file = tmp_path / f"test_mcpcat_{uuid.uuid4()}.log"
+
+        with patch("mcpcat.modules.logging._log_path", str(log_file)):
+            write_to_log("100% done %s")
+            write_to_log_lazy("server %d ready", 42)
+            flush_log()
+
+        content = log_file.read_text()
+        assert "100% done %s" in content
+        assert "server 42 ready" in content
+
+    def test_batched_timestamps_match_entry_times(self):
+        """Writer-side rendering reproduces each entry's own timestamp."""
+        from mcpcat.modules.logging import _render_entries, _utc_timestamp
+
+        base = 1_700_000_000_999_999_000
+        entries = [("p", base, "a", ()), ("p", base + 2_000, "b %d", (1,))]
+        lines = _render_entries(entries).splitlines()
+        assert lines == [
+            f"[{_utc_timestamp(base)}] a",
+            f"[{_utc_timestamp(base + 2_000)}] b 1",
+        ]
+        # The second entry crossed into the next second
+        assert lines[1].startswith("[2023-11-14T22:13:21.000001+00:00]")
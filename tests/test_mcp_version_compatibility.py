@@ -2,7 +2,13 @@
 
 import pytest
 
-from mcpcat.modules.compatibility import is_compatible_server
+from mcpcat.modules.compatibility import (
+    SERVER_KIND_LOWLEVEL,
+    SERVER_KIND_OFFICIAL_FASTMCP,
+    _server_kind_cache,
+    classify_server,
+    is_compatible_server,
+)
 from mcp import ClientSession
 
 from .test_utils.client import create_test_client
@@ -21,6 +27,33 @@ class TestMCPVersionCompatibility:
         result = is_compatible_server(server)
         assert result is True
 
+    def test_classify_server_is_cached_per_class(self):
+        """Classification should be computed once and reused for the same class."""
+        server = create_todo_server()
+        _server_kind_cache.pop(type(server), None)
+
+        kind = classify_server(server)
+        assert kind.is_official_fastmcp is True
+        assert kind.is_community_v2 is False
+        assert kind.is_community_v3 is False
+        assert kind.is_compatible is True
+        assert kind.flags == SERVER_KIND_OFFICIAL_FASTMCP
+        assert _server_kind_cache[type(server)] is kind
+
+        # A second instance of the same class hits the cache
+        assert classify_server(create_todo_server()) is kind
+
+    def test_incompatible_object_is_classified(self):
+        """Arbitrary objects are classified as incompatible."""
+
+        class NotAServer:
+            pass
+
+        kind = classify_server(NotAServer())
+        assert kind.is_compatible is False
+        assert kind.flags == SERVER_KIND_LOWLEVEL
+        assert is_compatible_server(NotAServer()) is False
+
     @pytest.mark.asyncio
     async def test_tool_call_via_client(self):
         """Test making a tool call using the client helper."""
@@ -35,3 +68,24 @@ class TestMCPVersionCompatibility:
             # Verify by listing todos
             result = await client.call_tool("list_todos")
             assert "1: Test todo item ○" in result.content[0].text
+
+    def test_is_mcp_error_response(self):
+        """Error responses report the first text content."""
+        from mcp import ServerResult
+        from mcp.types import CallToolResult, TextContent
+
+        from mcpcat.modules.compatibility import is_mcp_error_response
+
+        ok = ServerResult(CallToolResult(content=[], isError=False))
+        assert is_mcp_error_response(ok) == (False, "")
+
+        empty = ServerResult(CallToolResult(content=[], isError=True))
+        assert is_mcp_error_response(empty) == (True, "Unknown error")
+
+        failed = ServerResult(
+            CallToolResult(
+                content=[TextContent(type="text", text="boom")], isError=True
+            )
+        )
+        assert is_mcp_error_response(failed) == (True, "boom")
+        assert is_mcp_error_response(object()) == (False, "")
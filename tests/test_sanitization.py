@@ -1,8 +1,12 @@
 """Unit tests for the sanitization module."""
 
+import base64
 import copy
+import os
+from functools import lru_cache
 
 import pytest
+from pydantic_core import to_json
 
 from mcpcat.modules.sanitization import (
     sanitize_event,
@@ -27,13 +31,21 @@ def _make_event(**overrides) -> UnredactedEvent:
     return UnredactedEvent(**defaults)
 
 
+@lru_cache(maxsize=None)
 def _large_base64(length: int = 20_000) -> str:
-    """Return a valid base64-ish string of at least *length* chars."""
+    """Return a valid base64-ish string of at least *length* chars.
+
+    Cached: strings are immutable, so tests can share one instance.
+    """
     # Repeating 'QUFB' (base64 for 'AAA') to reach desired length, then pad.
     unit = "QUFB"
     return (unit * ((length // len(unit)) + 1))[:length] + "=="
 
 
+# ~26 KB of text, with a non-base64 character (space) at offset 5
+_LARGE_NON_B64 = "hello world! " * 2000
+
+
 class TestResponseContentSanitization:
     """Tests 1–9: sanitization of response content blocks."""
 
@@ -167,10 +179,62 @@ class TestParameterScanning:
 
     def test_large_non_base64_unchanged(self):
         """12. Large non-base64 (>10KB) — unchanged."""
-        large_text = "hello world! " * 2000  # ~26 KB, contains spaces
-        event = _make_event(parameters={"essay": large_text})
+        event = _make_event(parameters={"essay": _LARGE_NON_B64})
+        result = sanitize_event(event)
+        assert result.parameters["essay"] == _LARGE_NON_B64
+
+    def test_prefilter_rejects_early(self):
+        """An early non-base64 character is rejected by the prefix sniff,
+        before the full-string check runs."""
+
+        class NoFullCheck(str):
+            def rstrip(self, chars=None):
+                raise AssertionError("full base64 check reached")
+
+        value = NoFullCheck(_LARGE_NON_B64)
+        assert _scan_for_base64(value) is value
+
+    def test_line_wrapped_base64_redacted(self):
+        """Line-wrapped (MIME-style) base64 is still detected."""
+        big = _large_base64()
+        wrapped = "\n".join(big[i : i + 76] for i in range(0, len(big), 76))
+        event = _make_event(parameters={"file": wrapped})
+        result = sanitize_event(event)
+        assert result.parameters["file"] == _BINARY_DATA_REDACTED
+
+    def test_padded_encodebytes_output_redacted(self):
+        """MIME base64 with padding before its final newline is detected."""
+        for size in (15001, 15002):
+            encoded = base64.encodebytes(os.urandom(size)).decode("ascii")
+            assert encoded.endswith(("=\n", "==\n"))
+            event = _make_event(parameters={"file": encoded})
+            result = sanitize_event(event)
+            assert result.parameters["file"] == _BINARY_DATA_REDACTED
+
+    def test_large_string_with_late_non_base64_char_unchanged(self):
+        """A non-base64 character past the sniffed prefix still rules it out."""
+        text = _large_base64() + "!"
+        event = _make_event(parameters={"file": text})
         result = sanitize_event(event)
-        assert result.parameters["essay"] == large_text
+        assert result.parameters["file"] == text
+
+    def test_padding_only_allowed_at_end(self):
+        """'=' inside the string isn't base64 padding — unchanged."""
+        value = "A" * 6000 + "=" + "A" * 6000
+        assert _scan_for_base64(value) == value
+        assert _scan_for_base64("A" * 12_000 + "==") == _BINARY_DATA_REDACTED
+
+    def test_trailing_newline_only_allowed_after_padding(self):
+        """One newline may follow the padding, as the original regex allowed."""
+        body = "A" * 12_000
+        assert _scan_for_base64(body + "==\n") == _BINARY_DATA_REDACTED
+        assert _scan_for_base64(body + "\r\n") == _BINARY_DATA_REDACTED
+        for value in (body + "==\n\n", body + "=\r\n", body + "=\n="):
+            assert _scan_for_base64(value) == value
+
+    def test_large_non_ascii_string_unchanged(self):
+        value = "A" * 12_000 + "\u00e9"
+        assert _scan_for_base64(value) == value
 
     def test_deeply_nested_large_base64_found(self):
         """13. Deeply nested large base64 — found and redacted."""
@@ -181,6 +245,23 @@ class TestParameterScanning:
         result = sanitize_event(event)
         assert result.parameters["a"]["b"]["c"]["d"] == _BINARY_DATA_REDACTED
 
+    def test_very_deep_nesting_does_not_hit_recursion_limit(self):
+        # Too deep for recursion: rescanned with an explicit stack
+        value = {"blob": _large_base64()}
+        for _ in range(5000):
+            value = [{"next": value}]
+        result = _scan_for_base64(value)
+        for _ in range(5000):
+            result = result[0]["next"]
+        assert result == {"blob": _BINARY_DATA_REDACTED}
+
+    def test_circular_reference_does_not_loop(self):
+        value = {"blob": _large_base64()}
+        value["self"] = value
+        result = _scan_for_base64(value)
+        assert result["blob"] == _BINARY_DATA_REDACTED
+        assert result["self"] is value
+
     def test_mixed_types_only_large_base64_redacted(self):
         """14. Mixed types — only large base64 redacted."""
         big = _large_base64()
@@ -217,6 +298,16 @@ class TestParameterScanning:
         assert _scan_for_base64(at_threshold) == _BINARY_DATA_REDACTED
         assert _scan_for_base64(below_threshold) == below_threshold
 
+    def test_container_and_string_subclasses_scanned(self):
+        """Subclasses of dict/list/str are scanned like the built-in types."""
+        from collections import OrderedDict
+
+        class B64(str):
+            pass
+
+        value = OrderedDict(items=[B64(_large_base64())])
+        assert _scan_for_base64(value) == {"items": [_BINARY_DATA_REDACTED]}
+
     def test_none_parameters_no_error(self):
         """17. None parameters — no error."""
         event = _make_event(parameters=None)
@@ -309,9 +400,9 @@ class TestSanitizationIntegration:
             parameters=copy.deepcopy(original_params),
         )
 
-        # Keep a reference to original data
-        original_response_snapshot = copy.deepcopy(event.response)
-        original_params_snapshot = copy.deepcopy(event.parameters)
+        # Serialized snapshots of the original data
+        original_response_snapshot = to_json(event.response)
+        original_params_snapshot = to_json(event.parameters)
 
         result = sanitize_event(event)
 
@@ -320,5 +411,23 @@ class TestSanitizationIntegration:
         assert result.parameters["blob"] == _BINARY_DATA_REDACTED
 
         # Original event should be untouched
-        assert event.response == original_response_snapshot
-        assert event.parameters == original_params_snapshot
+        assert to_json(event.response) == original_response_snapshot
+        assert to_json(event.parameters) == original_params_snapshot
+
+    def test_unchanged_subtrees_are_shared_not_copied(self):
+        """Only containers on the path to a replaced value are rebuilt."""
+        big = _large_base64()
+        untouched = {"nested": ["a", "b"]}
+        event = _make_event(
+            response={"content": [{"type": "text", "text": "ok"}]},
+            parameters={"keep": untouched, "blob": big},
+        )
+
+        result = sanitize_event(event)
+
+        assert result is not event
+        assert result.response is event.response
+        assert result.parameters is not event.parameters
+        assert result.parameters["keep"] is untouched
+        assert result.parameters["blob"] == _BINARY_DATA_REDACTED
+        assert event.parameters["blob"] == big
@@ -8,6 +8,8 @@ import pytest
 from mcpcat import MCPCatOptions, track
 from mcpcat.modules.event_queue import EventQueue, set_event_queue
 from mcpcat.modules.truncation import (
+    _TRUNCATION_PASSES,
+    _truncate_fields,
     _truncate_value,
     truncate_event,
     MAX_STRING_BYTES,
@@ -58,6 +60,16 @@ class TestStringTruncation:
         # Verify valid UTF-8 — would raise if broken
         result.encode("utf-8")
 
+    def test_multibyte_string_under_byte_limit_unchanged(self):
+        # More characters than MAX_STRING_BYTES / 4 but fewer bytes than the limit
+        s = "\u00e9" * (MAX_STRING_BYTES // 2)
+        assert _truncate_value(s) == s
+
+    def test_truncated_string_fits_max_bytes(self):
+        for s in ("a" * 20000, "\u00e9" * 20000, "a\U0001f600" * 5000):
+            result = _truncate_value(s, max_string_bytes=1000)
+            assert len(result.encode("utf-8")) <= 1000
+
 
 class TestDepthLimiting:
     """Structures nested beyond MAX_DEPTH are replaced with a marker."""
@@ -98,6 +110,16 @@ class TestDepthLimiting:
         assert result["event_type"] == "mcp:tools/call"
         assert result["parameters"] == "[nested content truncated by MCPcat at depth 0]"
 
+    def test_very_deep_nesting_does_not_hit_recursion_limit(self):
+        # The walk is iterative, so depth is bounded by max_depth only
+        value = "leaf"
+        for _ in range(5000):
+            value = [value]
+        result = _truncate_value(value, max_depth=10000)
+        for _ in range(5000):
+            result = result[0]
+        assert result == "leaf"
+
 
 class TestBreadthLimiting:
     """Dicts/lists with more than MAX_BREADTH items are trimmed."""
@@ -156,6 +178,13 @@ class TestTruncateEventFastPath:
     def test_none_returns_none(self):
         assert truncate_event(None) is None
 
+    def test_event_without_truncatable_fields_not_serialized(self):
+        event = _make_event()
+        with patch("mcpcat.modules.truncation.to_json") as to_json:
+            result = truncate_event(event)
+        assert result is event
+        to_json.assert_not_called()
+
 
 class TestTruncateEventOversized:
     """Events over MAX_EVENT_BYTES are truncated."""
@@ -264,6 +293,46 @@ class TestSizeGuarantee:
         result_bytes = len(result.model_dump_json().encode("utf-8"))
         assert result_bytes <= MAX_EVENT_BYTES
 
+    def test_loosest_fitting_pass_is_chosen(self):
+        """The searched result matches trying every pass in order."""
+        params = {f"key_{i}": "x" * 10_000 for i in range(200)}
+        event = _make_event(parameters=params)
+        event_dict = event.model_dump()
+        expected = next(
+            candidate
+            for candidate in (
+                UnredactedEvent.model_validate(_truncate_fields(event_dict, *limits))
+                for limits in _TRUNCATION_PASSES
+            )
+            if len(candidate.model_dump_json().encode("utf-8")) <= MAX_EVENT_BYTES
+        )
+        with patch(
+            "mcpcat.modules.truncation._truncate_fields", wraps=_truncate_fields
+        ) as truncate_pass:
+            result = truncate_event(event)
+        assert result.parameters == expected.parameters
+        assert truncate_pass.call_count < len(_TRUNCATION_PASSES) // 2
+
+    def test_fitting_pass_found_when_tightest_pass_grows(self):
+        """A looser pass that fits is used when markers make the tightest too big."""
+        event = UnredactedEvent(
+            event_type="mcp:tools/call",
+            resource_name="r" * (MAX_EVENT_BYTES - 595),
+            session_id="s",
+            parameters={"a": "abc"},
+            response={"b": "y" * 5000},
+        )
+        event_dict = event.model_dump()
+        tightest = UnredactedEvent.model_validate(
+            _truncate_fields(event_dict, *_TRUNCATION_PASSES[-1])
+        )
+        # Short strings grow into markers at the tightest limits
+        assert len(tightest.model_dump_json().encode("utf-8")) > MAX_EVENT_BYTES
+
+        result = truncate_event(event)
+        assert len(result.model_dump_json().encode("utf-8")) <= MAX_EVENT_BYTES
+        assert result.parameters == {"a": "abc"}
+
 
 class TestTruncateEventErrorHandling:
     """Truncation failures return the original event."""